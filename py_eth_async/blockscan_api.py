@@ -1,7 +1,18 @@
-from typing import Optional, Union, List, Dict, Any
-
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, lru_cache
+from typing import Optional, Union, List, Dict, Any, Tuple, AsyncIterator, Callable, Set
+
+import aiohttp
 from fake_useragent import UserAgent
-from pretty_utils.miscellaneous.http import aiohttp_params
 
 from py_eth_async import exceptions
 from py_eth_async.utils import async_get
@@ -56,6 +67,153 @@ class SyncMode:
     Archive: str = 'archive'
 
 
+_TAGS = frozenset((Tag.Earliest, Tag.Pending, Tag.Latest))
+_SORTS = frozenset((Sort.Asc, Sort.Desc))
+_BLOCK_TYPES = frozenset((BlockType.Blocks, BlockType.Uncles))
+_CLOSESTS = frozenset((Closest.Before, Closest.After))
+_CLIENT_TYPES = frozenset((ClientType.Geth, ClientType.Parity))
+_SYNC_MODES = frozenset((SyncMode.Default, SyncMode.Archive))
+_BALANCE_TTL = 0.5
+# For how many seconds responses of endpoints that change every block, slowly, or daily are reused
+_FAST_TTL = 5
+_SLOW_TTL = 60
+_DAILY_TTL = 3600
+# Responses for a block height aren't cached forever, since the block may still be reorganized
+_BLOCK_TTL = _SLOW_TTL
+# Explorers don't return transactions past this many with pagination
+_MAX_PAGED_RESULTS = 10_000
+
+
+@lru_cache(maxsize=1)
+def _chrome_user_agent() -> str:
+    """
+    Get a Chrome user agent once per process, since 'fake_useragent' loads its data on every 'UserAgent' creation.
+
+    Returns:
+        str: the user agent.
+
+    """
+    return UserAgent().chrome
+
+
+def _drop_none(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Remove params that aren't specified from a dictionary and convert bool and bytes values to strings in place
+    instead of copying it for every request.
+
+    Args:
+        params (Dict[str, Any]): request params.
+
+    Returns:
+        Dict[str, Any]: the same dictionary.
+
+    """
+    if any(value is None or isinstance(value, (bool, bytes)) for value in params.values()):
+        for key, value in list(params.items()):
+            if value is None:
+                del params[key]
+
+            elif isinstance(value, bool):
+                params[key] = str(value).lower()
+
+            elif isinstance(value, bytes):
+                params[key] = value.decode()
+
+    return params
+
+
+# Event loop -> the connector shared by all sessions in it and the number of sessions using it. Connectors reference
+# their loop, so entries are removed explicitly when released or when their loop is closed.
+_connectors: Dict[asyncio.AbstractEventLoop, List[Any]] = {}
+
+
+async def _acquire_connector() -> aiohttp.TCPConnector:
+    """
+    Get the connector shared by sessions in the running event loop, so instances for different clients and networks
+    use one connection pool and DNS cache.
+
+    Returns:
+        aiohttp.TCPConnector: the connector.
+
+    """
+    for closed_loop in [loop for loop in _connectors if loop.is_closed()]:
+        await _connectors.pop(closed_loop)[0].close()
+
+    loop = asyncio.get_running_loop()
+    shared = _connectors.get(loop)
+    if shared is None or shared[0].closed:
+        shared = _connectors[loop] = [
+            aiohttp.TCPConnector(limit=128, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75), 0
+        ]
+
+    shared[1] += 1
+    return shared[0]
+
+
+async def _release_connector(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Stop using the connector shared by sessions in an event loop and close it if no session uses it anymore.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): the event loop.
+
+    """
+    shared = _connectors.get(loop)
+    if shared is None:
+        return
+
+    shared[1] -= 1
+    if shared[1] <= 0:
+        del _connectors[loop]
+        await shared[0].close()
+
+
+def _daily_ttl(enddate: str) -> float:
+    """
+    Get for how many seconds a response with daily statistics can be reused.
+
+    Args:
+        enddate (str): the ending date in the yyyy-MM-dd format.
+
+    Returns:
+        float: 'math.inf' if the range ended before today (UTC), otherwise an hour.
+
+    """
+    return math.inf if enddate < time.strftime('%Y-%m-%d', time.gmtime()) else _DAILY_TTL
+
+
+def _is_verified(response: Dict[str, Any]) -> bool:
+    """
+    Check if a 'getsourcecode' response contains a source code, since the response for an unverified contract is
+        successful too and it changes after the contract is verified.
+
+    Args:
+        response (Dict[str, Any]): the response.
+
+    Returns:
+        bool: True if the contract is verified.
+
+    """
+    result = response.get('result')
+    return bool(isinstance(result, list) and result and all(item.get('SourceCode') for item in result))
+
+
+def _cache_key(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Get a hashable key of request params.
+
+    Args:
+        params (Dict[str, Any]): request params.
+
+    Returns:
+        Tuple[Tuple[str, Any], ...]: the key.
+
+    """
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value) for key, value in sorted(params.items())
+    )
+
+
 class APIFunctions:
     """
     Class with functions related to Blockscan API.
@@ -73,28 +231,380 @@ class APIFunctions:
         gastracker (Gastracker): functions related to 'gastracker' API module.
         stats (Stats): functions related to 'stats' API module.
 
+    The modules share one session, so connections to the explorer are kept alive between requests. Sessions of all
+    instances in an event loop use one connection pool. Close the session with 'close' (or 'aclose') or by using the
+    instance as an async context manager when it's no longer needed. When the instance is used in another event loop,
+    the session of the previous loop is closed.
+
+    Concurrent identical requests share one HTTP request, and successful responses of endpoints that don't change, or
+    change slowly, are cached. Shared and cached responses are the same objects for all callers and mustn't be
+    modified.
+
     """
+    cache_size: int = 10_000
 
-    def __init__(self, key: str, url: str) -> None:
+    def __init__(
+            self, key: str, url: str, max_concurrency: Optional[int] = 5, rate: Optional[float] = 5,
+            cache_dir: Optional[str] = None
+    ) -> None:
         """
         Initialize the class.
 
         Args:
             key (str): an API key.
             url (str): an API entrypoint URL.
+            max_concurrency (Optional[int]): the maximum number of simultaneous requests, None to not limit it. (5)
+            rate (Optional[float]): the maximum number of requests per second, None to not limit it. It's halved for a
+                second after the API reports that the rate limit is reached. (5)
+            cache_dir (Optional[str]): the directory to keep responses that never change in, e.g. contract ABIs and
+                source codes, so they aren't requested again after a restart. (aren't kept between runs)
 
         """
         self.key = key
         self.url = url
-        self.headers = {'content-type': 'application/json', 'user-agent': UserAgent().chrome}
-        self.account = Account(self.key, self.url, self.headers)
-        self.contract = Contract(self.key, self.url, self.headers)
-        self.transaction = Transaction(self.key, self.url, self.headers)
-        self.block = Block(self.key, self.url, self.headers)
-        self.logs = Logs(self.key, self.url, self.headers)
-        self.token = Token(self.key, self.url, self.headers)
-        self.gastracker = Gastracker(self.key, self.url, self.headers)
-        self.stats = Stats(self.key, self.url, self.headers)
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.cache_dir = cache_dir
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        self._disk_executor: Optional[ThreadPoolExecutor] = None
+        self.headers = {'content-type': 'application/json', 'user-agent': _chrome_user_agent()}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cache: OrderedDict[Tuple[Tuple[str, Any], ...], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._in_flight: Dict[Tuple[Tuple[str, Any], ...], asyncio.Future] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._next_request = 0.0
+        self._slowed_down_until = 0.0
+        self.account = Account(self.key, self.url, self.headers, self)
+        self.contract = Contract(self.key, self.url, self.headers, self)
+        self.transaction = Transaction(self.key, self.url, self.headers, self)
+        self.block = Block(self.key, self.url, self.headers, self)
+        self.logs = Logs(self.key, self.url, self.headers, self)
+        self.token = Token(self.key, self.url, self.headers, self)
+        self.gastracker = Gastracker(self.key, self.url, self.headers, self)
+        self.stats = Stats(self.key, self.url, self.headers, self)
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """
+        Get the current session shared by the modules, use 'get_session' to create it if needed.
+
+        Returns:
+            Optional[aiohttp.ClientSession]: the session or None if it hasn't been created yet or was closed.
+
+        """
+        return self._session
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session shared by the modules. It's created on the first request in each event loop, since a session
+        can't be used outside the loop it was created in, and the session of the previous loop is closed.
+
+        Returns:
+            aiohttp.ClientSession: the session.
+
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            await self._close_session()
+            self._session = aiohttp.ClientSession(
+                headers=self.headers, connector=await _acquire_connector(), connector_owner=False
+            )
+            self._session_loop = loop
+
+        return self._session
+
+    async def _close_session(self) -> None:
+        """
+        Close the shared session and stop using the connector of its event loop.
+        """
+        if self._session is not None:
+            if not self._session.closed:
+                await self._session.close()
+                await _release_connector(self._session_loop)
+
+            self._session = None
+            self._session_loop = None
+
+    async def get(
+            self, params: Dict[str, Any], ttl: Optional[float] = None,
+            cacheable: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the API using the shared session.
+
+        Args:
+            params (Dict[str, Any]): request params, the ones that are None are removed from the dictionary.
+            ttl (Optional[float]): for how many seconds a successful response can be reused, 'math.inf' for responses
+                that never change. (isn't cached)
+            cacheable (Optional[Callable[[Dict[str, Any]], bool]]): the function that checks if a successful response
+                can be cached. (any)
+
+        Returns:
+            Dict[str, Any]: the response.
+
+        """
+        _drop_none(params)
+        key = _cache_key(params)
+        cached = self._cache.get(key) if ttl is not None else None
+        if cached:
+            expires, response = cached
+            if expires > time.monotonic():
+                self._cache.move_to_end(key)
+                return response
+
+            del self._cache[key]
+
+        if ttl == math.inf and self.cache_dir:
+            response = await asyncio.get_running_loop().run_in_executor(self.disk_executor, self._disk_get, key)
+            if response is not None and (cacheable is None or cacheable(response)):
+                self._remember(key, ttl, response)
+                return response
+
+        request = self._in_flight.get(key)
+        if request is None or request.get_loop() is not asyncio.get_running_loop():
+            request = asyncio.ensure_future(self._request(params))
+            self._in_flight[key] = request
+            request.add_done_callback(partial(self._cache_response, key, ttl, cacheable))
+
+        # The request isn't cancelled with one of the callers waiting for it
+        return await asyncio.shield(request)
+
+    async def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Make a request to the API within the concurrency and rate limits.
+
+        Args:
+            params (Dict[str, Any]): request params.
+
+        Returns:
+            Dict[str, Any]: the response.
+
+        """
+        if not self.max_concurrency:
+            return await self._paced_request(params)
+
+        # A semaphore is bound to the loop it's first used in, the one of the previous loop is dropped
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        async with self._semaphore:
+            return await self._paced_request(params)
+
+    async def _paced_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wait for a free slot according to the rate and make a request to the API.
+
+        Args:
+            params (Dict[str, Any]): request params.
+
+        Returns:
+            Dict[str, Any]: the response.
+
+        """
+        if self.rate:
+            now = time.monotonic()
+            interval = 1 / self.rate
+            if now < self._slowed_down_until:
+                interval *= 2
+
+            # The slot is reserved before sleeping, so concurrent requests are spread evenly
+            start = max(now, self._next_request)
+            self._next_request = start + interval
+            if start > now:
+                await asyncio.sleep(start - now)
+
+        try:
+            response = await async_get(self.url, params=params, headers=self.headers, session=await self.get_session())
+
+        except exceptions.HTTPException as e:
+            if e.status_code == 429:
+                self._slowed_down_until = time.monotonic() + 1
+
+            raise
+
+        if isinstance(response, dict) and response.get('status') == '0' and 'rate limit' in str(response.get('result')):
+            self._slowed_down_until = time.monotonic() + 1
+
+        return response
+
+    def _remember(self, key: Tuple[Tuple[str, Any], ...], expires: float, response: Dict[str, Any]) -> None:
+        """
+        Put a response into the memory cache evicting the least recently used one if the cache is full.
+
+        Args:
+            key (Tuple[Tuple[str, Any], ...]): the key of request params.
+            expires (float): when the response expires according to 'time.monotonic'.
+            response (Dict[str, Any]): the response.
+
+        """
+        self._cache[key] = (expires, response)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _cache_response(
+            self, key: Tuple[Tuple[str, Any], ...], ttl: Optional[float],
+            cacheable: Optional[Callable[[Dict[str, Any]], bool]], request: asyncio.Future
+    ) -> None:
+        """
+        Forget a finished request and cache its response if it's successful.
+
+        Args:
+            key (Tuple[Tuple[str, Any], ...]): the key of request params.
+            ttl (Optional[float]): for how many seconds the response can be reused, None to not cache it.
+            cacheable (Optional[Callable[[Dict[str, Any]], bool]]): the function that checks if a successful response
+                can be cached.
+            request (asyncio.Future): the finished request.
+
+        """
+        if self._in_flight.get(key) is request:
+            del self._in_flight[key]
+
+        if ttl is None or request.cancelled() or request.exception():
+            return
+
+        response = request.result()
+        # Etherscan reports errors, e.g. the rate limit, with the 200 status code
+        if (
+                isinstance(response, dict) and response.get('status') == '1'
+                and (cacheable is None or cacheable(response))
+        ):
+            self._remember(key, time.monotonic() + ttl, response)
+            if ttl == math.inf and self.cache_dir:
+                request.get_loop().run_in_executor(self.disk_executor, self._disk_set, key, response)
+
+    @property
+    def disk_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread the disk cache is used in, so reads and writes don't block the event loop. There is only one
+        thread, so the database connection isn't shared between threads and writes are made in order.
+
+        Returns:
+            ThreadPoolExecutor: the executor.
+
+        """
+        if self._disk_executor is None:
+            self._disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='blockscan-disk-cache')
+
+        return self._disk_executor
+
+    @property
+    def disk_cache(self) -> sqlite3.Connection:
+        """
+        Get the database with responses that never change, creating it on the first use. It's used only in the
+        'disk_executor' thread.
+
+        Returns:
+            sqlite3.Connection: the database connection.
+
+        """
+        if self._disk_cache is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._disk_cache = sqlite3.connect(os.path.join(self.cache_dir, 'responses.sqlite3'))
+            self._disk_cache.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)')
+
+        return self._disk_cache
+
+    def _disk_key(self, key: Tuple[Tuple[str, Any], ...]) -> str:
+        """
+        Get a database key of request params. It doesn't include the API key, so responses are shared between keys.
+
+        Args:
+            key (Tuple[Tuple[str, Any], ...]): the key of request params.
+
+        Returns:
+            str: the database key.
+
+        """
+        return json.dumps([self.url, [item for item in key if item[0] != 'apikey']])
+
+    def _disk_get(self, key: Tuple[Tuple[str, Any], ...]) -> Optional[Dict[str, Any]]:
+        """
+        Get a response from the database.
+
+        Args:
+            key (Tuple[Tuple[str, Any], ...]): the key of request params.
+
+        Returns:
+            Optional[Dict[str, Any]]: the response or None if it isn't there.
+
+        """
+        row = self.disk_cache.execute('SELECT response FROM responses WHERE key = ?', (self._disk_key(key),)).fetchone()
+        if row:
+            return json.loads(row[0])
+
+    def _disk_set(self, key: Tuple[Tuple[str, Any], ...], response: Dict[str, Any]) -> None:
+        """
+        Save a response to the database.
+
+        Args:
+            key (Tuple[Tuple[str, Any], ...]): the key of request params.
+            response (Dict[str, Any]): the response.
+
+        """
+        with self.disk_cache:
+            self.disk_cache.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?)', (self._disk_key(key), json.dumps(response))
+            )
+
+    def copy_with(self, key: str, url: str) -> APIFunctions:
+        """
+        Create an instance with another API key or URL and the same settings. It takes over the session and the disk
+        cache of this instance, so they aren't left open, and this instance shouldn't be used after that.
+
+        Args:
+            key (str): an API key.
+            url (str): an API entrypoint URL.
+
+        Returns:
+            APIFunctions: the new instance.
+
+        """
+        functions = APIFunctions(
+            key=key, url=url, max_concurrency=self.max_concurrency, rate=self.rate, cache_dir=self.cache_dir
+        )
+        functions._session, self._session = self._session, None
+        functions._session_loop, self._session_loop = self._session_loop, None
+        functions._disk_cache, self._disk_cache = self._disk_cache, None
+        functions._disk_executor, self._disk_executor = self._disk_executor, None
+        return functions
+
+    async def close(self) -> None:
+        """
+        Close the shared session and the disk cache. The connector is closed as well if no other instance uses it.
+        """
+        await self._close_session()
+        self._semaphore = None
+        self._semaphore_loop = None
+        if self._disk_executor is not None:
+            # The connection is closed after the writes that are already scheduled
+            await asyncio.get_running_loop().run_in_executor(self._disk_executor, self._close_disk_cache)
+            self._disk_executor.shutdown(wait=False)
+            self._disk_executor = None
+
+    def _close_disk_cache(self) -> None:
+        """
+        Close the disk cache.
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    async def aclose(self) -> None:
+        """
+        Close the shared session and the disk cache, the same as 'close'.
+        """
+        await self.close()
+
+    async def __aenter__(self) -> APIFunctions:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
 
 
 class Module:
@@ -106,14 +616,19 @@ class Module:
         url (str): an API entrypoint URL.
         headers (Dict[str, Any]): a headers for requests.
         module (str): a module name.
+        functions (Optional[APIFunctions]): the functions instance whose session is used for requests.
 
     """
+    __slots__ = ('key', 'url', 'headers', 'functions', '_params')
     key: str
     url: str
     headers: Dict[str, Any]
     module: str
+    functions: Optional[APIFunctions]
 
-    def __init__(self, key: str, url: str, headers: Dict[str, Any]) -> None:
+    def __init__(
+            self, key: str, url: str, headers: Dict[str, Any], functions: Optional[APIFunctions] = None
+    ) -> None:
         """
         Initialize the class.
 
@@ -121,19 +636,320 @@ class Module:
             key (str): an API key.
             url (str): an API entrypoint URL.
             headers (Dict[str, Any]): a headers for requests.
+            functions (Optional[APIFunctions]): the functions instance whose session is used for requests.
+                (a new session for each request)
 
         """
         self.key = key
         self.url = url
         self.headers = headers
+        self.functions = functions
+        self._params = {'module': self.module, 'apikey': self.key}
+
+    async def _get(
+            self, params: Dict[str, Any], ttl: Optional[float] = None,
+            cacheable: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the API.
+
+        Args:
+            params (Dict[str, Any]): request params.
+            ttl (Optional[float]): for how many seconds a successful response can be reused. (isn't cached)
+            cacheable (Optional[Callable[[Dict[str, Any]], bool]]): the function that checks if a successful response
+                can be cached. (any)
+
+        Returns:
+            Dict[str, Any]: the response.
+
+        """
+        if self.functions:
+            return await self.functions.get(params, ttl=ttl, cacheable=cacheable)
+
+        return await async_get(self.url, params=_drop_none(params), headers=self.headers)
+
+
+class _BalanceBatcher:
+    """
+    An instance that collects concurrent 'balance' calls and sends them as 'balancemulti' requests.
+
+    Attributes:
+        account (Account): the module to make requests with.
+        window (float): for how many seconds calls are collected before sending them.
+        max_size (int): the maximum number of addresses in one 'balancemulti' request.
+
+    """
+    __slots__ = ('account', '_pending', '_timer', '_tasks')
+    window: float = 0.005
+    max_size: int = 20
+
+    def __init__(self, account: Account) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            account (Account): the module to make requests with.
+
+        """
+        self.account = account
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop keeps only weak references to tasks, so they're kept here until they're done
+        self._tasks: Set[asyncio.Future] = set()
+
+    def add(self, address: str, tag: str) -> asyncio.Future:
+        """
+        Add a balance request to the next batch.
+
+        Args:
+            address (str): the address to check for balance.
+            tag (str): the pre-defined block parameter.
+
+        Returns:
+            asyncio.Future: the future with the same response as the 'balance' action returns.
+
+        """
+        loop = asyncio.get_running_loop()
+        if self._pending and self._pending[0][2].get_loop() is not loop:
+            self._pending = []
+            self._timer = None
+
+        future = loop.create_future()
+        self._pending.append((address, tag, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return future
+
+    def _flush(self) -> None:
+        """
+        Send the collected requests grouped by tag.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        batches: Dict[str, List[Tuple[str, str, asyncio.Future]]] = {}
+        for request in pending:
+            batches.setdefault(request[1], []).append(request)
+
+        for tag, batch in batches.items():
+            task = asyncio.ensure_future(self._send(tag, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, tag: str, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        """
+        Get balances of a batch and set the results of its futures.
+
+        Args:
+            tag (str): the pre-defined block parameter.
+            batch (List[Tuple[str, str, asyncio.Future]]): the requests.
+
+        """
+        # The futures are resolved even if something fails, otherwise their callers would wait forever
+        try:
+            responses: Dict[str, Dict[str, Any]] = {}
+            addresses = list(dict.fromkeys(address.lower() for address, _, _ in batch))
+            if len(addresses) > 1:
+                try:
+                    response = await self.account.balancemulti(addresses, tag)
+                    if (
+                            isinstance(response, dict) and response.get('status') == '1'
+                            and isinstance(response.get('result'), list)
+                    ):
+                        for balance in response['result']:
+                            responses[balance['account'].lower()] = {
+                                'status': response['status'], 'message': response.get('message'),
+                                'result': balance['balance']
+                            }
+
+                except (
+                        exceptions.HTTPException, aiohttp.ClientError, asyncio.TimeoutError, KeyError, TypeError
+                ):
+                    # Transport errors and an unexpected response shape
+                    responses = {}
+
+            # Single addresses and the ones the batch request failed for are requested one by one
+            missing = [address for address in addresses if address not in responses]
+            results = await asyncio.gather(
+                *(self.account._balance(address, tag) for address in missing), return_exceptions=True
+            )
+            responses.update(zip(missing, results))
+            for address, _, future in batch:
+                if future.done():
+                    continue
+
+                response = responses[address.lower()]
+                if isinstance(response, BaseException):
+                    future.set_exception(response)
+
+                else:
+                    future.set_result(response)
+
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+        finally:
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel()
 
 
 class Account(Module):
     """
     Class with functions related to 'account' API module.
+
+    Concurrent 'balance' calls of an instance that belongs to an 'APIFunctions' are sent together as 'balancemulti'
+    requests.
     """
+    __slots__ = ('_balances',)
     module: str = 'account'
 
+    def __init__(
+            self, key: str, url: str, headers: Dict[str, Any], functions: Optional[APIFunctions] = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            key (str): an API key.
+            url (str): an API entrypoint URL.
+            headers (Dict[str, Any]): a headers for requests.
+            functions (Optional[APIFunctions]): the functions instance whose session is used for requests.
+                (a new session for each request)
+
+        """
+        super().__init__(key, url, headers, functions)
+        self._balances = _BalanceBatcher(self)
+
+    async def _paged_query(
+            self, action: str, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, page: Optional[int] = None, offset: Optional[int] = None,
+            sort: Union[str, Sort] = Sort.Asc
+    ) -> Dict[str, Any]:
+        """
+        Make a request to an action that returns a paginated list of transactions performed by an address.
+
+        Args:
+            action (str): the action name.
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            page (Optional[int]): the page number, if pagination is enabled.
+            offset (Optional[int]): the number of transactions displayed per page.
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+
+        Returns:
+            Dict[str, Any]: the dictionary with the list of transactions.
+
+        """
+        if sort not in _SORTS:
+            raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
+
+        params = dict(
+            self._params, action=action, address=address, sort=sort, contractaddress=contractaddress,
+            startblock=startblock, endblock=endblock, page=page, offset=offset
+        )
+        return await self._get(params)
+
+    async def _paged_iter(
+            self, action: str, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, offset: int = 1000, sort: Union[str, Sort] = Sort.Asc
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over transactions of a paginated action page by page.
+
+        Args:
+            action (str): the action name.
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: the transactions.
+
+        """
+        page = 1
+        while True:
+            response = await self._paged_query(
+                action, address=address, contractaddress=contractaddress, startblock=startblock, endblock=endblock,
+                page=page, offset=offset, sort=sort
+            )
+            txs = response.get('result')
+            # An empty list comes with the '0' status and the 'No transactions found' message
+            if not isinstance(txs, list):
+                raise exceptions.APIException(str(txs))
+
+            for tx in txs:
+                yield tx
+
+            if len(txs) < offset or (page + 1) * offset > _MAX_PAGED_RESULTS:
+                return
+
+            page += 1
+
+    async def _paged_all(
+            self, action: str, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, offset: int = 1000, sort: Union[str, Sort] = Sort.Asc,
+            pages_at_once: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all transactions of a paginated action requesting several pages at once.
+
+        Args:
+            action (str): the action name.
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+            pages_at_once (int): the number of pages requested concurrently. (5)
+
+        Returns:
+            List[Dict[str, Any]]: the transactions.
+
+        """
+        all_txs = []
+        last_page = max(_MAX_PAGED_RESULTS // offset, 1)
+        page = 1
+        # The first page is requested alone since most addresses don't have more
+        pages = 1
+        while page <= last_page:
+            responses = await asyncio.gather(*(
+                self._paged_query(
+                    action, address=address, contractaddress=contractaddress, startblock=startblock,
+                    endblock=endblock, page=page_, offset=offset, sort=sort
+                ) for page_ in range(page, min(page + pages, last_page + 1))
+            ))
+            for response in responses:
+                txs = response.get('result')
+                if not isinstance(txs, list):
+                    raise exceptions.APIException(str(txs))
+
+                all_txs.extend(txs)
+                if len(txs) < offset:
+                    return all_txs
+
+            page += pages
+            pages = pages_at_once
+
+        return all_txs
+
     async def balance(self, address: str, tag: Union[str, Tag] = Tag.Latest) -> Dict[str, Any]:
         """
         Return the Ether balance of a given address.
@@ -148,18 +964,28 @@ class Account(Module):
             Dict[str, Any]: the dictionary with the Ether balance of the address in wei.
 
         """
-        action = 'balance'
-        if tag not in ('earliest', 'pending', 'latest'):
+        if tag not in _TAGS:
             raise exceptions.APIException('"tag" parameter have to be either "earliest", "pending" or "latest"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'tag': tag
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        if self.functions:
+            return await self._balances.add(address, tag)
+
+        return await self._balance(address, tag)
+
+    async def _balance(self, address: str, tag: Union[str, Tag] = Tag.Latest) -> Dict[str, Any]:
+        """
+        Request the Ether balance of a given address without batching.
+
+        Args:
+            address (str): the address to check for balance
+            tag (Union[str, Tag]): the pre-defined block parameter, either "earliest", "pending" or "latest". ("latest")
+
+        Returns:
+            Dict[str, Any]: the dictionary with the Ether balance of the address in wei.
+
+        """
+        params = dict(self._params, action='balance', address=address, tag=tag)
+        return await self._get(params, ttl=_BALANCE_TTL)
 
     async def balancemulti(self, addresses: List[str], tag: Union[str, Tag] = Tag.Latest) -> Dict[str, Any]:
         """
@@ -176,17 +1002,11 @@ class Account(Module):
 
         """
         action = 'balancemulti'
-        if tag not in ('earliest', 'pending', 'latest'):
+        if tag not in _TAGS:
             raise exceptions.APIException('"tag" parameter have to be either "earliest", "pending" or "latest"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': addresses,
-            'tag': tag
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=','.join(addresses), tag=tag)
+        return await self._get(params)
 
     async def txlist(
             self, address: str, startblock: Optional[int] = None, endblock: Optional[int] = None,
@@ -210,23 +1030,57 @@ class Account(Module):
             Dict[str, Any]: the dictionary with the list of transactions performed by the address.
 
         """
-        action = 'txlist'
-        if sort not in ('asc', 'desc'):
-            raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
+        return await self._paged_query(
+            'txlist', address=address, startblock=startblock, endblock=endblock, page=page, offset=offset, sort=sort
+        )
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'sort': sort,
-            'startblock': startblock,
-            'endblock': endblock,
-            'page': page,
-            'offset': offset
-        }
+    async def txlist_all(
+            self, address: str, startblock: Optional[int] = None, endblock: Optional[int] = None, offset: int = 1000,
+            sort: Union[str, Sort] = Sort.Asc, pages_at_once: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Return all transactions performed by an address, requesting several pages at once. Explorers return at most
+            10,000 transactions this way, use "startblock" to get the next ones.
 
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        Args:
+            address (str): the address to get the transaction list.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+            pages_at_once (int): the number of pages requested concurrently. (5)
+
+        Returns:
+            List[Dict[str, Any]]: the transactions performed by the address.
+
+        """
+        return await self._paged_all(
+            'txlist', address, startblock=startblock, endblock=endblock, offset=offset, sort=sort,
+            pages_at_once=pages_at_once
+        )
+
+    def txlist_iter(
+            self, address: str, startblock: Optional[int] = None, endblock: Optional[int] = None, offset: int = 1000,
+            sort: Union[str, Sort] = Sort.Asc
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over transactions performed by an address, requesting them page by page. Only one page is kept in
+            memory at a time, and transactions can be processed while the next pages aren't requested yet.
+
+        Args:
+            address (str): the address to get the transaction list.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: the transactions performed by the address.
+
+        """
+        return self._paged_iter('txlist', address, startblock=startblock, endblock=endblock, offset=offset, sort=sort)
 
     async def txlistinternal(
             self, address: Optional[str] = None, txhash: Optional[str] = None, startblock: Optional[int] = None,
@@ -253,37 +1107,22 @@ class Account(Module):
 
         """
         action = 'txlistinternal'
-        if sort not in ('asc', 'desc'):
+        if sort not in _SORTS:
             raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key
-        }
+        if txhash:
+            params = dict(self._params, action=action, txhash=txhash)
 
-        if not address and not txhash:
-            if not startblock and endblock:
+        else:
+            if not address and (startblock is None or endblock is None):
                 raise exceptions.APIException('Specify "startblock" an "endblock" parameters')
 
-            params['startblock'] = startblock
-            params['endblock'] = endblock
-            params['sort'] = sort
-            params['page'] = page
-            params['offset'] = offset
+            params = dict(
+                self._params, action=action, address=address, sort=sort, startblock=startblock, endblock=endblock,
+                page=page, offset=offset
+            )
 
-        elif txhash:
-            params['txhash'] = txhash
-
-        else:
-            params['address'] = address
-            params['sort'] = sort
-            params['startblock'] = startblock
-            params['endblock'] = endblock
-            params['page'] = page
-            params['offset'] = offset
-
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        return await self._get(params)
 
     async def tokentx(
             self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
@@ -309,23 +1148,64 @@ class Account(Module):
             Dict[str, Any]: the dictionary with the list of ERC-20 token transactions performed by the address.
 
         """
-        action = 'tokentx'
-        if sort not in ('asc', 'desc'):
-            raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
+        return await self._paged_query(
+            'tokentx', address=address, contractaddress=contractaddress, startblock=startblock,
+            endblock=endblock, page=page, offset=offset, sort=sort
+        )
+
+    async def tokentx_all(
+            self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, offset: int = 1000, sort: Union[str, Sort] = Sort.Asc,
+            pages_at_once: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Return all ERC-20 token transfers of an address, requesting several pages at once. Explorers return at most
+            10,000 transactions this way, use "startblock" to get the next ones.
+
+        Args:
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+            pages_at_once (int): the number of pages requested concurrently. (5)
+
+        Returns:
+            List[Dict[str, Any]]: the ERC-20 token transactions performed by the address.
+
+        """
+        return await self._paged_all(
+            'tokentx', address, contractaddress=contractaddress, startblock=startblock, endblock=endblock,
+            offset=offset, sort=sort, pages_at_once=pages_at_once
+        )
+
+    def tokentx_iter(
+            self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, offset: int = 1000, sort: Union[str, Sort] = Sort.Asc
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over ERC-20 token transfers of an address, requesting them page by page. Only one page is kept in
+            memory at a time, and transfers can be processed while the next pages aren't requested yet.
+
+        Args:
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'sort': sort,
-            'contractaddress': contractaddress,
-            'startblock': startblock,
-            'endblock': endblock,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        Returns:
+            AsyncIterator[Dict[str, Any]]: the ERC-20 token transactions performed by the address.
+
+        """
+        return self._paged_iter(
+            'tokentx', address, contractaddress=contractaddress, startblock=startblock, endblock=endblock,
+            offset=offset, sort=sort
+        )
 
     async def tokennfttx(
             self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
@@ -351,23 +1231,38 @@ class Account(Module):
             Dict[str, Any]: the dictionary with the list of ERC-721 token transactions performed by the address.
 
         """
-        action = 'tokennfttx'
-        if sort not in ('asc', 'desc'):
-            raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
+        return await self._paged_query(
+            'tokennfttx', address=address, contractaddress=contractaddress, startblock=startblock,
+            endblock=endblock, page=page, offset=offset, sort=sort
+        )
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'sort': sort,
-            'contractaddress': contractaddress,
-            'startblock': startblock,
-            'endblock': endblock,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+    async def tokennfttx_all(
+            self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, offset: int = 1000, sort: Union[str, Sort] = Sort.Asc,
+            pages_at_once: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Return all ERC-721 token transfers of an address, requesting several pages at once. Explorers return at most
+            10,000 transactions this way, use "startblock" to get the next ones.
+
+        Args:
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+            pages_at_once (int): the number of pages requested concurrently. (5)
+
+        Returns:
+            List[Dict[str, Any]]: the ERC-721 token transactions performed by the address.
+
+        """
+        return await self._paged_all(
+            'tokennfttx', address, contractaddress=contractaddress, startblock=startblock, endblock=endblock,
+            offset=offset, sort=sort, pages_at_once=pages_at_once
+        )
 
     async def token1155tx(
             self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
@@ -393,23 +1288,38 @@ class Account(Module):
             Dict[str, Any]: the dictionary with the list of ERC-1155 token transactions performed by the address.
 
         """
-        action = 'token1155tx'
-        if sort not in ('asc', 'desc'):
-            raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
+        return await self._paged_query(
+            'token1155tx', address=address, contractaddress=contractaddress, startblock=startblock,
+            endblock=endblock, page=page, offset=offset, sort=sort
+        )
+
+    async def token1155tx_all(
+            self, address: str, contractaddress: Optional[str] = None, startblock: Optional[int] = None,
+            endblock: Optional[int] = None, offset: int = 1000, sort: Union[str, Sort] = Sort.Asc,
+            pages_at_once: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Return all ERC-1155 token transfers of an address, requesting several pages at once. Explorers return at most
+            10,000 transactions this way, use "startblock" to get the next ones.
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'sort': sort,
-            'contractaddress': contractaddress,
-            'startblock': startblock,
-            'endblock': endblock,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        Args:
+            address (str): the address to get the transaction list.
+            contractaddress (Optional[str]): the token contract address to check for transactions.
+            startblock (Optional[int]): the block number to start searching for transactions.
+            endblock (Optional[int]): the block number to stop searching for transactions.
+            offset (int): the number of transactions requested per page. (1000)
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+            pages_at_once (int): the number of pages requested concurrently. (5)
+
+        Returns:
+            List[Dict[str, Any]]: the ERC-1155 token transactions performed by the address.
+
+        """
+        return await self._paged_all(
+            'token1155tx', address, contractaddress=contractaddress, startblock=startblock, endblock=endblock,
+            offset=offset, sort=sort, pages_at_once=pages_at_once
+        )
 
     async def getminedblocks(
             self, address: str, blocktype: Union[str, BlockType] = BlockType.Blocks, page: Optional[int] = None,
@@ -432,19 +1342,11 @@ class Account(Module):
 
         """
         action = 'getminedblocks'
-        if blocktype not in ('blocks', 'uncles'):
+        if blocktype not in _BLOCK_TYPES:
             raise exceptions.APIException('"blocktype" parameter have to be either "blocks" or "uncles"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'blocktype': blocktype,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address, blocktype=blocktype, page=page, offset=offset)
+        return await self._get(params)
 
     async def balancehistory(self, address: str, blockno: int) -> Dict[str, Any]:
         """
@@ -461,14 +1363,8 @@ class Account(Module):
 
         """
         action = 'balancehistory'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'blockno': blockno
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address, blockno=blockno)
+        return await self._get(params, ttl=_BLOCK_TTL)
 
     async def tokenbalance(self, contractaddress: str, address: str) -> Dict[str, Any]:
         """
@@ -485,14 +1381,8 @@ class Account(Module):
 
         """
         action = 'tokenbalance'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'contractaddress': contractaddress,
-            'address': address
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, contractaddress=contractaddress, address=address)
+        return await self._get(params, ttl=_BALANCE_TTL)
 
     async def tokenbalancehistory(self, contractaddress: str, address: str, blockno: int) -> Dict[str, Any]:
         """
@@ -510,15 +1400,8 @@ class Account(Module):
 
         """
         action = 'tokenbalancehistory'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'contractaddress': contractaddress,
-            'address': address,
-            'blockno': blockno
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, contractaddress=contractaddress, address=address, blockno=blockno)
+        return await self._get(params, ttl=_BLOCK_TTL)
 
     async def addresstokenbalance(
             self, address: str, page: Optional[int] = None, offset: Optional[int] = None
@@ -538,15 +1421,8 @@ class Account(Module):
 
         """
         action = 'addresstokenbalance'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address, page=page, offset=offset)
+        return await self._get(params)
 
     async def addresstokennftbalance(
             self, address: str, page: Optional[int] = None, offset: Optional[int] = None
@@ -566,15 +1442,8 @@ class Account(Module):
 
         """
         action = 'addresstokennftbalance'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address, page=page, offset=offset)
+        return await self._get(params)
 
     async def addresstokennftinventory(
             self, address: str, page: Optional[int] = None, offset: Optional[int] = None
@@ -594,21 +1463,15 @@ class Account(Module):
 
         """
         action = 'addresstokennftinventory'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address, page=page, offset=offset)
+        return await self._get(params)
 
 
 class Contract(Module):
     """
     Class with functions related to 'contract' API module.
     """
+    __slots__ = ()
     module: str = 'contract'
 
     async def getabi(self, address: str) -> Dict[str, Any]:
@@ -625,13 +1488,8 @@ class Contract(Module):
 
         """
         action = 'getabi'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address)
+        return await self._get(params, ttl=math.inf)
 
     async def getsourcecode(self, address: str) -> Dict[str, Any]:
         """
@@ -647,13 +1505,8 @@ class Contract(Module):
 
         """
         action = 'getsourcecode'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=address)
+        return await self._get(params, ttl=math.inf, cacheable=_is_verified)
 
     async def getcontractcreation(self, addresses: List[str]) -> Dict[str, Any]:
         """
@@ -662,26 +1515,22 @@ class Contract(Module):
         https://docs.etherscan.io/api-endpoints/contracts#get-contract-creator-and-creation-tx-hash
 
         Args:
-            addresses (str): the contract address, up to 5 at a time.
+            addresses (List[str]): the contract addresses, up to 5 at a time.
 
         Returns:
             Dict[str, Any]: the dictionary with a contract's deployer address and transaction hash it was created.
 
         """
         action = 'getcontractcreation'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': addresses
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, address=','.join(addresses))
+        return await self._get(params, ttl=math.inf)
 
 
 class Transaction(Module):
     """
     Class with functions related to 'transaction' API module.
     """
+    __slots__ = ()
     module: str = 'transaction'
 
     async def getstatus(self, txhash: str) -> Dict[str, Any]:
@@ -698,13 +1547,8 @@ class Transaction(Module):
 
         """
         action = 'getstatus'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'txhash': txhash
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, txhash=txhash)
+        return await self._get(params)
 
     async def gettxreceiptstatus(self, txhash: str) -> Dict[str, Any]:
         """
@@ -720,19 +1564,15 @@ class Transaction(Module):
 
         """
         action = 'gettxreceiptstatus'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'txhash': txhash
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, txhash=txhash)
+        return await self._get(params)
 
 
 class Block(Module):
     """
     Class with functions related to 'block' API module.
     """
+    __slots__ = ()
     module: str = 'block'
 
     async def getblockreward(self, blockno: int) -> Dict[str, Any]:
@@ -749,13 +1589,8 @@ class Block(Module):
 
         """
         action = 'getblockreward'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'blockno': blockno
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, blockno=blockno)
+        return await self._get(params, ttl=_BLOCK_TTL)
 
     async def getblockcountdown(self, blockno: int) -> Dict[str, Any]:
         """
@@ -771,13 +1606,8 @@ class Block(Module):
 
         """
         action = 'getblockcountdown'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'blockno': blockno
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, blockno=blockno)
+        return await self._get(params)
 
     async def getblocknobytime(self, timestamp: int, closest: Union[str, Closest] = Closest.Before) -> Dict[str, Any]:
         """
@@ -795,23 +1625,18 @@ class Block(Module):
 
         """
         action = 'getblocknobytime'
-        if closest not in ('before', 'after'):
+        if closest not in _CLOSESTS:
             raise exceptions.APIException('"closest" parameter have to be either "before" or "after"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'timestamp': timestamp,
-            'closest': closest
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, timestamp=timestamp, closest=closest)
+        return await self._get(params)
 
 
 class Logs(Module):
     """
     Class with functions related to 'logs' API module.
     """
+    __slots__ = ()
     module: str = 'log'
 
     async def getLogs(
@@ -836,26 +1661,21 @@ class Logs(Module):
 
         """
         action = 'getLogs'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'address': address,
-            'fromBlock': fromBlock,
-            'toBlock': toBlock,
-            'page': page,
-            'offset': offset
-        }
+        params = dict(
+            self._params, action=action, address=address, fromBlock=fromBlock, toBlock=toBlock, page=page,
+            offset=offset
+        )
         for key, value in kwargs.items():
             params[key] = value
 
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        return await self._get(params)
 
 
 class Token(Module):
     """
     Class with functions related to 'token' API module.
     """
+    __slots__ = ()
     module: str = 'token'
 
     async def tokenholderlist(
@@ -877,15 +1697,8 @@ class Token(Module):
 
         """
         action = 'tokenholderlist'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'contractaddress': contractaddress,
-            'page': page,
-            'offset': offset
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, contractaddress=contractaddress, page=page, offset=offset)
+        return await self._get(params)
 
     async def tokeninfo(self, contractaddress: str) -> Dict[str, Any]:
         """
@@ -902,19 +1715,15 @@ class Token(Module):
 
         """
         action = 'tokeninfo'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'contractaddress': contractaddress
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, contractaddress=contractaddress)
+        return await self._get(params)
 
 
 class Gastracker(Module):
     """
     Class with functions related to 'gastracker' API module.
     """
+    __slots__ = ()
     module: str = 'gastracker'
 
     async def gasestimate(self, gasprice: int) -> Dict[str, Any]:
@@ -932,13 +1741,8 @@ class Gastracker(Module):
 
         """
         action = 'gasestimate'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'gasprice': gasprice
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, gasprice=gasprice)
+        return await self._get(params)
 
     async def gasoracle(self) -> Dict[str, Any]:
         """
@@ -951,18 +1755,15 @@ class Gastracker(Module):
 
         """
         action = 'gasoracle'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action)
+        return await self._get(params, ttl=_FAST_TTL)
 
 
 class Stats(Module):
     """
     Class with functions related to 'stats' API module.
     """
+    __slots__ = ()
     module: str = 'stats'
 
     async def ethsupply(self) -> Dict[str, Any]:
@@ -976,12 +1777,8 @@ class Stats(Module):
 
         """
         action = 'ethsupply'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action)
+        return await self._get(params, ttl=_SLOW_TTL)
 
     async def ethsupply2(self) -> Dict[str, Any]:
         """
@@ -994,12 +1791,8 @@ class Stats(Module):
 
         """
         action = 'ethsupply2'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action)
+        return await self._get(params, ttl=_SLOW_TTL)
 
     async def ethprice(self) -> Dict[str, Any]:
         """
@@ -1012,12 +1805,8 @@ class Stats(Module):
 
         """
         action = 'ethprice'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action)
+        return await self._get(params, ttl=_FAST_TTL)
 
     async def chainsize(
             self, startdate: str, enddate: str, clienttype: Union[str, ClientType] = ClientType.Geth,
@@ -1041,26 +1830,20 @@ class Stats(Module):
 
         """
         action = 'chainsize'
-        if clienttype not in ('geth', 'parity'):
+        if clienttype not in _CLIENT_TYPES:
             raise exceptions.APIException('"clienttype" parameter have to be either "geth" or "parity"')
 
-        if syncmode not in ('default', 'archive'):
+        if syncmode not in _SYNC_MODES:
             raise exceptions.APIException('"syncmode" parameter have to be either "default" or "archive"')
 
-        if sort not in ('asc', 'desc'):
+        if sort not in _SORTS:
             raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'startdate': startdate,
-            'enddate': enddate,
-            'clienttype': clienttype,
-            'syncmode': syncmode,
-            'sort': sort
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(
+            self._params, action=action, startdate=startdate, enddate=enddate, clienttype=clienttype, syncmode=syncmode,
+            sort=sort
+        )
+        return await self._get(params, ttl=_daily_ttl(enddate))
 
     async def nodecount(self) -> Dict[str, Any]:
         """
@@ -1073,12 +1856,8 @@ class Stats(Module):
 
         """
         action = 'nodecount'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action)
+        return await self._get(params, ttl=_SLOW_TTL)
 
     async def general(
             self, action: str, startdate: str, enddate: str, sort: Union[str, Sort] = Sort.Asc
@@ -1097,18 +1876,33 @@ class Stats(Module):
             Dict[str, Any]: the dictionary with the data.
 
         """
-        if sort not in ('asc', 'desc'):
+        if sort not in _SORTS:
             raise exceptions.APIException('"sort" parameter have to be either "asc" or "desc"')
 
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'startdate': startdate,
-            'enddate': enddate,
-            'sort': sort
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, startdate=startdate, enddate=enddate, sort=sort)
+        return await self._get(params, ttl=_daily_ttl(enddate))
+
+    async def daily_batch(
+            self, actions: List[str], startdate: str, enddate: str, sort: Union[str, Sort] = Sort.Asc
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Request several daily statistics for the same date range at once.
+
+        Args:
+            actions (List[str]): the action names, e.g. "dailytx" and "dailygasused".
+            startdate (str): the starting date in yyyy-MM-dd format, eg. 2019-02-01.
+            enddate (str): the ending date in yyyy-MM-dd format, eg. 2019-02-28.
+            sort (Union[str, Sort]): the sorting preference, use "asc" to sort by ascending and "desc" to sort
+                by descending. ("asc")
+
+        Returns:
+            Dict[str, Dict[str, Any]]: the dictionary with the data by the action names.
+
+        """
+        results = await asyncio.gather(
+            *(self.general(action=action, startdate=startdate, enddate=enddate, sort=sort) for action in actions)
+        )
+        return dict(zip(actions, results))
 
     async def dailytxnfee(self, startdate: str, enddate: str, sort: Union[str, Sort] = Sort.Asc) -> Dict[str, Any]:
         """
@@ -1428,13 +2222,8 @@ class Stats(Module):
 
         """
         action = 'tokensupply'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'contractaddress': contractaddress
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, contractaddress=contractaddress)
+        return await self._get(params)
 
     async def tokensupplyhistory(self, contractaddress: str, blockno: int) -> Dict[str, Any]:
         """
@@ -1451,11 +2240,5 @@ class Stats(Module):
 
         """
         action = 'tokensupplyhistory'
-        params = {
-            'module': self.module,
-            'action': action,
-            'apikey': self.key,
-            'contractaddress': contractaddress,
-            'blockno': blockno
-        }
-        return await async_get(self.url, params=aiohttp_params(params), headers=self.headers)
+        params = dict(self._params, action=action, contractaddress=contractaddress, blockno=blockno)
+        return await self._get(params, ttl=_BLOCK_TTL)
@@ -1,8 +1,7 @@
 import random
-from typing import Optional
+from typing import Optional, List
 
 import aiohttp
-import requests
 from aiohttp_socks import ProxyConnector
 from eth_account.signers.local import LocalAccount
 from fake_useragent import UserAgent
@@ -24,15 +23,21 @@ class Client:
         network (Network): a network instance.
         account (Optional[LocalAccount]): imported account.
         w3 (Web3): a Web3 instance.
+        ipfs_gateway (str): the IPFS gateway URL to which paths of 'ipfs://' URLs are appended.
+        ipfs_fallback_gateways (List[str]): IPFS gateways requested along with the main one, the fastest response is
+            used.
 
     """
     network: Network
     account: Optional[LocalAccount]
     w3: Web3
+    ipfs_gateway: str
+    ipfs_fallback_gateways: List[str]
 
     def __init__(
             self, private_key: Optional[str] = None, network: Network = Networks.Goerli, proxy: Optional[str] = None,
-            check_proxy: bool = True
+            check_proxy: bool = True, ipfs_gateway: str = 'https://ipfs.io/ipfs/',
+            ipfs_fallback_gateways: Optional[List[str]] = None
     ) -> None:
         """
         Initialize the class.
@@ -50,9 +55,16 @@ class Client:
                 - http://proxy:port
 
             check_proxy (bool): check if the proxy is working. (True)
+            ipfs_gateway (str): the IPFS gateway URL to get NFT metadata from, e.g. a local or a dedicated one.
+                ('https://ipfs.io/ipfs/')
+            ipfs_fallback_gateways (Optional[List[str]]): IPFS gateways to request NFT metadata from at the same time
+                as from the main one to use the fastest response, e.g. 'https://dweb.link/ipfs/'. CIDs are sent to
+                all of them. (only the main one is used)
 
         """
         self.network = network
+        self.ipfs_gateway = ipfs_gateway
+        self.ipfs_fallback_gateways = ipfs_fallback_gateways or []
         self.headers = {
             'accept': '*/*',
             'accept-language': 'en-US,en;q=0.9',
@@ -68,6 +80,8 @@ class Client:
 
                 self.connector = ProxyConnector.from_url(url=self.proxy)
                 if check_proxy:
+                    import requests
+
                     your_ip = requests.get(
                         'http://eth0.me/', proxies={'http': self.proxy, 'https': self.proxy}, timeout=10
                     ).text.rstrip()
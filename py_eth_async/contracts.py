@@ -1,7 +1,9 @@
 import asyncio
 import json
+from collections import OrderedDict
 from typing import Union, Optional, List, Dict, Any, Tuple
 
+import aiohttp
 from eth_typing import ChecksumAddress
 from evmdasm import EvmBytecode
 from pretty_utils.type_functions.strings import text_between
@@ -11,6 +13,9 @@ from py_eth_async.data import types
 from py_eth_async.data.models import DefaultABIs, ABI, Function, RawContract
 from py_eth_async.utils import checksum, async_get
 
+# Multicall3 is deployed at the same address on most networks
+MULTICALL3_ADDRESS = checksum('0xcA11bde05977b3631167028862bE2a173976CA11')
+
 
 class Contracts:
     """
@@ -19,7 +24,11 @@ class Contracts:
     Attributes:
         client (Client): the Client instance.
 
+    Contract instances with the default ABIs are cached, the least recently used ones are dropped when there are more
+    than 'cache_size' of them.
+
     """
+    cache_size: int = 256
 
     def __init__(self, client) -> None:
         """
@@ -30,21 +39,27 @@ class Contracts:
 
         """
         self.client = client
+        self._default_contracts: OrderedDict[Tuple[str, ChecksumAddress], AsyncContract] = OrderedDict()
+        self._default_contracts_w3 = None
 
     @staticmethod
-    async def get_signature(hex_signature: str) -> Optional[list]:
+    async def get_signature(hex_signature: str, session: Optional[aiohttp.ClientSession] = None) -> Optional[list]:
         """
         Find all matching signatures in the database of https://www.4byte.directory/.
 
         Args:
             hex_signature (str): a signature hash.
+            session (Optional[aiohttp.ClientSession]): a session to make the request with, e.g. to keep the connection
+                alive for several lookups. (a new session for this request)
 
         Returns:
             Optional[list]: matches found.
 
         """
         try:
-            response = await async_get(f'https://www.4byte.directory/api/v1/signatures/?hex_signature={hex_signature}')
+            response = await async_get(
+                f'https://www.4byte.directory/api/v1/signatures/?hex_signature={hex_signature}', session=session
+            )
             results = response['results']
             return [m['text_signature'] for m in sorted(results, key=lambda result: result['created_at'])]
 
@@ -149,14 +164,15 @@ class Contracts:
             hex_signatures = list(hex_signatures)
 
             text_signatures = []
-            for i, hex_signature in enumerate(hex_signatures):
-                signature_for_hash = await Contracts.get_signature(hex_signature=hex_signature)
-                while signature_for_hash is None:
-                    await asyncio.sleep(1)
-                    signature_for_hash = await Contracts.get_signature(hex_signature=hex_signature)
+            async with aiohttp.ClientSession() as session:
+                for i, hex_signature in enumerate(hex_signatures):
+                    signature_for_hash = await Contracts.get_signature(hex_signature=hex_signature, session=session)
+                    while signature_for_hash is None:
+                        await asyncio.sleep(1)
+                        signature_for_hash = await Contracts.get_signature(hex_signature=hex_signature, session=session)
 
-                if signature_for_hash:
-                    text_signatures.append(signature_for_hash[0])
+                    if signature_for_hash:
+                        text_signatures.append(signature_for_hash[0])
 
             for text_signature in text_signatures:
                 try:
@@ -182,7 +198,7 @@ class Contracts:
 
         """
         contract_address, abi = await self.get_contract_attributes(contract_address)
-        return self.client.w3.eth.contract(address=contract_address, abi=DefaultABIs.Token)
+        return self._default_contract('token', contract_address, DefaultABIs.Token)
 
     async def default_nft(self, contract_address: types.Contract) -> AsyncContract:
         """
@@ -196,7 +212,47 @@ class Contracts:
 
         """
         contract_address, abi = await self.get_contract_attributes(contract_address)
-        return self.client.w3.eth.contract(address=contract_address, abi=DefaultABIs.NFT)
+        return self._default_contract('nft', contract_address, DefaultABIs.NFT)
+
+    def default_multicall(self) -> AsyncContract:
+        """
+        Get the Multicall3 contract instance to make several calls in one request.
+
+        Returns:
+            AsyncContract: the Multicall3 contract instance.
+
+        """
+        return self._default_contract('multicall3', MULTICALL3_ADDRESS, DefaultABIs.Multicall3)
+
+    def _default_contract(self, kind: str, contract_address: ChecksumAddress, abi: list) -> AsyncContract:
+        """
+        Get a contract instance with a default ABI. Instances are cached per address and Web3 instance, since
+        building one parses the whole ABI.
+
+        Args:
+            kind (str): the name of the default ABI.
+            contract_address (ChecksumAddress): the contract address.
+            abi (list): the default ABI.
+
+        Returns:
+            AsyncContract: the contract instance.
+
+        """
+        if self._default_contracts_w3 is not self.client.w3:
+            self._default_contracts = OrderedDict()
+            self._default_contracts_w3 = self.client.w3
+
+        key = (kind, contract_address)
+        contract = self._default_contracts.get(key)
+        if contract is None:
+            contract = self._default_contracts[key] = self.client.w3.eth.contract(address=contract_address, abi=abi)
+            if len(self._default_contracts) > self.cache_size:
+                self._default_contracts.popitem(last=False)
+
+        else:
+            self._default_contracts.move_to_end(key)
+
+        return contract
 
     async def get(
             self, contract_address: types.Contract, abi: Optional[Union[list, str]] = None,
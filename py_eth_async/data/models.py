@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional, Union, Dict, List, Any, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Union, Dict, List, Any, Tuple, Type, Iterator, Iterable
 
-import requests
 from eth_typing import ChecksumAddress
-from eth_utils import to_wei, from_wei
+from eth_utils import to_wei
 from pretty_utils.type_functions.classes import AutoRepr
 from web3 import Web3
 
@@ -16,6 +20,31 @@ from py_eth_async.blockscan_api import APIFunctions
 from py_eth_async.utils import checksum
 
 
+class SlotsRepr:
+    """
+    Contains a __repr__ function that builds the output of a class using its public slots and properties, since there
+    is no __dict__ to take variables from in slotted classes. A class can specify the fields in '_repr_fields' itself.
+    """
+    __slots__ = ()
+    _repr_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        slots = []
+        properties = []
+        for class_ in reversed(cls.__mro__):
+            class_slots = class_.__dict__.get('__slots__', ())
+            slots.extend((class_slots,) if isinstance(class_slots, str) else class_slots)
+            properties.extend(name for name, value in class_.__dict__.items() if isinstance(value, property))
+
+        if '_repr_fields' not in cls.__dict__:
+            cls._repr_fields = tuple(name for name in dict.fromkeys(slots + properties) if not name.startswith('_'))
+
+    def __repr__(self) -> str:
+        values = ('{}={!r}'.format(key, getattr(self, key)) for key in self._repr_fields)
+        return '{}({})'.format(self.__class__.__name__, ', '.join(values))
+
+
 @dataclass
 class API:
     """
@@ -44,6 +73,7 @@ class DEX:
         router (Optional[ChecksumAddress]): a router contract address.
 
     """
+    __slots__ = ('name', 'factory', 'router')
     name: str
     factory: Optional[ChecksumAddress]
     router: Optional[ChecksumAddress]
@@ -54,6 +84,25 @@ class DEX:
         self.router = checksum(router) if router else None
 
 
+# A timeout in seconds of requests made to complete a network info
+_probe_timeout = 10
+
+
+@lru_cache(maxsize=1)
+def _get_chains() -> List[Dict[str, Any]]:
+    """
+    Get the list of networks from the chainid.network, it's downloaded once per process.
+
+    Returns:
+        List[Dict[str, Any]]: the list of networks.
+
+    """
+    # Imported here, because only networks without a specified coin symbol need it
+    import requests
+
+    return requests.get('https://chainid.network/chains.json', timeout=_probe_timeout).json()
+
+
 class Network(AutoRepr):
     """
     An instance of a network that is used in the Client.
@@ -106,33 +155,106 @@ class Network(AutoRepr):
         self.api = api
         self.dex = dex
 
-        if not self.chain_id:
-            try:
-                self.chain_id = Web3(Web3.HTTPProvider(self.rpc)).eth.chain_id
-
-            except:
-                pass
-
-        if not self.coin_symbol:
-            try:
-                response = requests.get('https://chainid.network/chains.json').json()
-                network = next((network for network in response if network['chainId'] == self.chain_id), None)
-                self.coin_symbol = network['nativeCurrency']['symbol']
-
-            except:
-                pass
+        if not self.chain_id or not self.coin_symbol:
+            self._resolve_network_info()
 
         if self.coin_symbol:
             self.coin_symbol = self.coin_symbol.upper()
 
         self.set_api_functions()
 
+    @classmethod
+    def _preset(
+            cls, name: str, rpc: str, chain_id: int, tx_type: int, coin_symbol: str, explorer: Optional[str] = None,
+            api: Optional[API] = None, dex: Optional[DEX] = None
+    ) -> Network:
+        """
+        Create a network from constants that are already normalized, so their normalization and network probes are
+        skipped.
+
+        Args:
+            name (str): a lowercase network name.
+            rpc (str): the RPC URL.
+            chain_id (int): the chain ID.
+            tx_type (int): the main type of transactions in the network. Either 0 (legacy) or 2 (EIP-1559).
+            coin_symbol (str): the uppercase coin symbol.
+            explorer (Optional[str]): the explorer URL. (None)
+            api (Optional[API]): an API instance. (None)
+            dex (Optional[DEX]): a DEX instance. (None)
+
+        Returns:
+            Network: the network.
+
+        """
+        network = cls.__new__(cls)
+        network.name = name
+        network.rpc = rpc
+        network.chain_id = chain_id
+        network.tx_type = tx_type
+        network.coin_symbol = coin_symbol
+        network.explorer = explorer
+        network.api = api
+        network.dex = dex
+        network.set_api_functions()
+        return network
+
+    def _resolve_network_info(self) -> None:
+        """
+        Get the missing chain ID and coin symbol. The list of networks is downloaded while the RPC is being asked.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            chains = executor.submit(_get_chains) if not self.coin_symbol else None
+            if not self.chain_id:
+                self.chain_id = self._resolve_chain_id()
+
+            if chains:
+                self.coin_symbol = self._resolve_coin_symbol(chains=chains)
+
+    def _resolve_chain_id(self) -> Optional[int]:
+        """
+        Get the chain ID from the RPC.
+
+        Returns:
+            Optional[int]: the chain ID.
+
+        """
+        try:
+            provider = Web3.HTTPProvider(self.rpc, request_kwargs={'timeout': _probe_timeout})
+            return Web3(provider).eth.chain_id
+
+        except:
+            pass
+
+    def _resolve_coin_symbol(self, chains: Future) -> Optional[str]:
+        """
+        Find the coin symbol in the list of networks from the chainid.network.
+
+        Args:
+            chains (Future): the future with the list of networks.
+
+        Returns:
+            Optional[str]: the coin symbol.
+
+        """
+        try:
+            network = next((network for network in chains.result() if network['chainId'] == self.chain_id), None)
+            return network['nativeCurrency']['symbol']
+
+        except:
+            pass
+
     def set_api_functions(self) -> None:
         """
-        Update API functions after API key change.
+        Update API functions after API key change. The new functions take over the session of the previous ones, so
+        close them with 'await network.api.functions.close()' before the event loop ends.
         """
         if self.api and self.api.key and self.api.url:
-            self.api.functions = APIFunctions(self.api.key, self.api.url)
+            functions = self.api.functions
+            if functions is None:
+                self.api.functions = APIFunctions(self.api.key, self.api.url)
+
+            elif functions.key != self.api.key or functions.url != self.api.url:
+                self.api.functions = functions.copy_with(self.api.key, self.api.url)
 
     def is_equal(self, network: Network) -> bool:
         """
@@ -151,9 +273,12 @@ class Network(AutoRepr):
 class Networks:
     """
     An instance with the most popular networks.
+
+    The API functions of the networks keep a session open after the first request, close them with
+    'await Networks.Ethereum.api.functions.close()' (or use them with 'async with') before the event loop ends.
     """
     # Mainnets
-    Ethereum = Network(
+    Ethereum = Network._preset(
         name='ethereum',
         rpc='https://rpc.ankr.com/eth/',
         chain_id=1,
@@ -166,7 +291,7 @@ class Networks:
             router='0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D'
         )
     )
-    Arbitrum = Network(
+    Arbitrum = Network._preset(
         name='arbitrum',
         rpc='https://rpc.ankr.com/arbitrum/',
         chain_id=42161,
@@ -179,7 +304,7 @@ class Networks:
             router='0xE592427A0AEce92De3Edee1F18E0157C05861564'
         )
     )
-    ArbitrumNova = Network(
+    ArbitrumNova = Network._preset(
         name='arbitrum nova',
         rpc='https://nova.arbitrum.io/rpc/',
         chain_id=42170,
@@ -190,7 +315,7 @@ class Networks:
             key=config.ARBITRUM_API_KEY, url='https://api-nova.arbiscan.io/api', docs='https://nova.arbiscan.io/apis/'
         )
     )
-    Optimism = Network(
+    Optimism = Network._preset(
         name='optimism',
         rpc='https://rpc.ankr.com/optimism/',
         chain_id=10,
@@ -203,7 +328,7 @@ class Networks:
         ),
         dex=DEX(name='uniswap_v3', router='0xE592427A0AEce92De3Edee1F18E0157C05861564')
     )
-    BSC = Network(
+    BSC = Network._preset(
         name='bsc',
         rpc='https://rpc.ankr.com/bsc/',
         chain_id=56,
@@ -216,7 +341,7 @@ class Networks:
             router='0x10ED43C718714eb63d5aA57B78B54704E256024E'
         )
     )
-    Polygon = Network(
+    Polygon = Network._preset(
         name='polygon',
         rpc='https://rpc.ankr.com/polygon/',
         chain_id=137,
@@ -231,7 +356,7 @@ class Networks:
             router='0xa5E0829CaCEd8fFDD4De3c43696c57F7D7A678ff'
         )
     )
-    Avalanche = Network(
+    Avalanche = Network._preset(
         name='avalanche',
         rpc='https://rpc.ankr.com/avalanche/',
         chain_id=43114,
@@ -243,7 +368,7 @@ class Networks:
             docs='https://snowtrace.io/documentation'
         )
     )
-    zkSyncEra = Network(
+    zkSyncEra = Network._preset(
         name='zksync era',
         rpc='https://rpc.ankr.com/zksync_era/',
         chain_id=324,
@@ -254,7 +379,7 @@ class Networks:
             key=config.ZKSYNC_ERA_API_KEY, url='https://api-era.zksync.network/api', docs='https://docs.zksync.network/'
         )
     )
-    Moonbeam = Network(
+    Moonbeam = Network._preset(
         name='moonbeam',
         rpc='https://rpc.api.moonbeam.network/',
         chain_id=1284,
@@ -265,7 +390,7 @@ class Networks:
             key=config.MOONBEAM_API_KEY, url='https://api-moonbeam.moonscan.io/api', docs='https://moonscan.io/apis/'
         )
     )
-    Fantom = Network(
+    Fantom = Network._preset(
         name='fantom',
         rpc='https://rpc.ankr.com/fantom/',
         chain_id=250,
@@ -274,7 +399,7 @@ class Networks:
         explorer='https://ftmscan.com/',
         api=API(key=config.FANTOM_API_KEY, url='https://api.ftmscan.com/api', docs='https://docs.ftmscan.com/')
     )
-    Celo = Network(
+    Celo = Network._preset(
         name='celo',
         rpc='https://rpc.ankr.com/celo/',
         chain_id=42220,
@@ -283,16 +408,16 @@ class Networks:
         explorer='https://celoscan.io/',
         api=API(key=config.CELO_API_KEY, url='https://api.celoscan.io/api', docs='https://celoscan.io/apis/')
     )
-    Gnosis = Network(
+    Gnosis = Network._preset(
         name='gnosis',
         rpc='https://rpc.ankr.com/gnosis/',
         chain_id=100,
         tx_type=2,
-        coin_symbol='xDAI',
+        coin_symbol='XDAI',
         explorer='https://gnosisscan.io/',
         api=API(key=config.GNOSIS_API_KEY, url='https://api.gnosisscan.io/api', docs='https://docs.gnosisscan.io/')
     )
-    HECO = Network(
+    HECO = Network._preset(
         name='heco',
         rpc='https://http-mainnet.hecochain.com/',
         chain_id=128,
@@ -303,7 +428,7 @@ class Networks:
     )
 
     # Testnets
-    Goerli = Network(
+    Goerli = Network._preset(
         name='goerli',
         rpc='https://rpc.ankr.com/eth_goerli/',
         chain_id=5,
@@ -316,7 +441,7 @@ class Networks:
         )
     )
 
-    Sepolia = Network(
+    Sepolia = Network._preset(
         name='sepolia',
         rpc='https://rpc.ankr.com/eth_sepolia/',
         chain_id=11155111,
@@ -478,6 +603,35 @@ class DefaultABIs:
             'stateMutability': 'view',
             'type': 'function'
         }]
+    Multicall3 = [
+        {
+            'inputs': [
+                {
+                    'components': [
+                        {'internalType': 'address', 'name': 'target', 'type': 'address'},
+                        {'internalType': 'bool', 'name': 'allowFailure', 'type': 'bool'},
+                        {'internalType': 'bytes', 'name': 'callData', 'type': 'bytes'}
+                    ],
+                    'internalType': 'struct Multicall3.Call3[]',
+                    'name': 'calls',
+                    'type': 'tuple[]'
+                }
+            ],
+            'name': 'aggregate3',
+            'outputs': [
+                {
+                    'components': [
+                        {'internalType': 'bool', 'name': 'success', 'type': 'bool'},
+                        {'internalType': 'bytes', 'name': 'returnData', 'type': 'bytes'}
+                    ],
+                    'internalType': 'struct Multicall3.Result[]',
+                    'name': 'returnData',
+                    'type': 'tuple[]'
+                }
+            ],
+            'stateMutability': 'payable',
+            'type': 'function'
+        }]
 
 
 @dataclass
@@ -490,6 +644,7 @@ class FunctionArgument:
         type (str): an argument type.
 
     """
+    __slots__ = ('name', 'type')
     name: str
     type: str
 
@@ -505,11 +660,33 @@ class Function:
         outputs (List[FunctionArgument]): a list of output arguments.
 
     """
+    __slots__ = ('name', 'inputs', 'outputs')
     name: str
     inputs: List[FunctionArgument]
     outputs: List[FunctionArgument]
 
 
+# ABI strings parsed before, keyed by a digest of the JSON. The parsed ABI and its functions are kept pickled, so every
+# instance gets its own copy, and unpickling is faster than parsing. Lists aren't cached since hashing them costs more
+# than parsing
+_abi_cache_size = 256
+_abi_cache: Dict[bytes, bytes] = {}
+
+
+def _abi_key(abi: str) -> bytes:
+    """
+    Get a cache key of an ABI.
+
+    Args:
+        abi (str): an ABI of a contract.
+
+    Returns:
+        bytes: the cache key.
+
+    """
+    return hashlib.blake2b(abi.encode(), digest_size=16).digest()
+
+
 class ABI(AutoRepr):
     """
     An instance of an ABI.
@@ -530,10 +707,24 @@ class ABI(AutoRepr):
             abi (Union[List[Dict[str, Any]], str]): an ABI of a contract.
 
         """
-        self.abi = json.loads(abi) if isinstance(abi, str) else abi
         self.functions = None
+        if isinstance(abi, str):
+            key = _abi_key(abi)
+            cached = _abi_cache.get(key)
+            if cached is not None:
+                self.abi, self.functions = pickle.loads(cached)
+                return
 
-        self.parse_functions(abi=self.abi)
+            self.abi = json.loads(abi)
+            self.parse_functions(abi=self.abi)
+            if len(_abi_cache) >= _abi_cache_size:
+                del _abi_cache[next(iter(_abi_cache))]
+
+            _abi_cache[key] = pickle.dumps((self.abi, self.functions), protocol=pickle.HIGHEST_PROTOCOL)
+
+        else:
+            self.abi = abi
+            self.parse_functions(abi=abi)
 
     def parse_functions(self, abi: Union[List[Dict[str, Any]], str]) -> None:
         """
@@ -546,6 +737,9 @@ class ABI(AutoRepr):
         if not abi:
             return
 
+        if isinstance(abi, str):
+            abi = json.loads(abi)
+
         self.functions = []
         for function in abi:
             function_instance = Function(name=function.get('name'), inputs=[], outputs=[])
@@ -574,6 +768,7 @@ class NFTAttribute:
         value (Any): an attribute value.
 
     """
+    __slots__ = ('name', 'value')
     name: str
     value: Any
 
@@ -642,25 +837,86 @@ class NFT(AutoRepr):
 
         self.attributes = []
         for attribute in attributes:
-            name_key = list(attribute.keys())
-            name_key.remove('value')
-            name_key = name_key[0]
-            attr_name = attribute[name_key]
             attr_value = attribute['value']
+            if 'trait_type' in attribute:
+                attr_name = attribute['trait_type']
+
+            else:
+                attr_name = attribute[next(key for key in attribute if key != 'value')]
+
             self.attributes.append(NFTAttribute(name=attr_name, value=attr_value))
 
 
-class HistoryTx:
+class HistoryTx(SlotsRepr):
     """
     An instance of a history transaction.
     """
-    pass
+    __slots__ = ()
+    _str_keys: Tuple[str, ...] = ()
+    _int_keys: Tuple[str, ...] = ()
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._str_getter = itemgetter(*cls._str_keys)
+        cls._int_getter = itemgetter(*cls._int_keys)
 
-class CoinTx(AutoRepr, HistoryTx):
+    def _values(self, data: Dict[str, Any]) -> Tuple[Tuple[Optional[str], ...], Iterator[int]]:
+        """
+        Get string and integer fields of a raw transaction in one go.
+
+        Args:
+            data (Dict[str, Any]): the dictionary with a transaction data.
+
+        Returns:
+            Tuple[Tuple[Optional[str], ...], Iterator[int]]: string fields and integer fields.
+
+        """
+        try:
+            strs = self._str_getter(data)
+            ints = self._int_getter(data)
+
+        except KeyError:
+            # Some explorers omit optional fields
+            strs = tuple(map(data.get, self._str_keys))
+            ints = tuple(map(data.get, self._int_keys))
+
+        return strs, map(int, ints)
+
+
+class CoinTx(HistoryTx):
     """
     An instance of a coin transaction.
     """
+    __slots__ = (
+        'hash', 'from_', 'to_', 'contractAddress', 'value', 'methodId', 'functionName', 'isError', 'blockNumber',
+        'timeStamp', 'nonce', 'blockHash', 'transactionIndex', 'gas', 'gasUsed', 'gasPrice', 'txreceipt_status',
+        'input', 'cumulativeGasUsed', 'confirmations',
+    )
+    hash: str
+    from_: str
+    to_: str
+    contractAddress: str
+    value: int
+    methodId: str
+    functionName: str
+    isError: bool
+    blockNumber: int
+    timeStamp: int
+    nonce: int
+    blockHash: str
+    transactionIndex: int
+    gas: int
+    gasUsed: int
+    gasPrice: int
+    txreceipt_status: int
+    input: str
+    cumulativeGasUsed: int
+    confirmations: int
+    _str_keys = ('hash', 'methodId', 'functionName', 'blockHash', 'input')
+    _int_keys = (
+        'value', 'blockNumber', 'timeStamp', 'nonce', 'transactionIndex', 'gas', 'gasUsed', 'gasPrice',
+        'txreceipt_status', 'cumulativeGasUsed', 'confirmations'
+    )
 
     def __init__(self, data: Dict[str, Any]) -> None:
         """
@@ -670,33 +926,45 @@ class CoinTx(AutoRepr, HistoryTx):
             data (Dict[str, Any]): the dictionary with a coin transaction data.
 
         """
-        self.hash: str = data.get('hash')
-        self.from_: str = checksum(data.get('from'))
-        self.to_: str = checksum(data.get('to'))
-        self.contractAddress: str = checksum(data.get('contractAddress')) if data.get('contractAddress') else ''
-        self.value: int = int(data.get('value'))
-        self.methodId: str = data.get('methodId')
-        self.functionName: str = data.get('functionName')
-        self.isError: bool = bool(data.get('isError'))
-
-        self.blockNumber: int = int(data.get('blockNumber'))
-        self.timeStamp: int = int(data.get('timeStamp'))
-        self.nonce: int = int(data.get('nonce'))
-        self.blockHash: str = data.get('blockHash')
-        self.transactionIndex: int = int(data.get('transactionIndex'))
-        self.gas: int = int(data.get('gas'))
-        self.gasUsed: int = int(data.get('gasUsed'))
-        self.gasPrice: int = int(data.get('gasPrice'))
-        self.txreceipt_status: int = int(data.get('txreceipt_status'))
-        self.input: str = data.get('input')
-        self.cumulativeGasUsed: int = int(data.get('cumulativeGasUsed'))
-        self.confirmations: int = int(data.get('confirmations'))
+        strs, ints = self._values(data)
+        self.hash, self.methodId, self.functionName, self.blockHash, self.input = strs
+        (
+            self.value, self.blockNumber, self.timeStamp, self.nonce, self.transactionIndex, self.gas, self.gasUsed,
+            self.gasPrice, self.txreceipt_status, self.cumulativeGasUsed, self.confirmations
+        ) = ints
+        self.from_ = checksum(data.get('from'))
+        self.to_ = checksum(data.get('to'))
+        contract_address = data.get('contractAddress')
+        self.contractAddress = checksum(contract_address) if contract_address else ''
+        self.isError = bool(data.get('isError'))
 
 
-class InternalTx(AutoRepr, HistoryTx):
+class InternalTx(HistoryTx):
     """
     An instance of an internal transaction.
     """
+    __slots__ = (
+        'hash', 'from_', 'to_', 'contractAddress', 'value', 'isError', 'errCode', 'blockNumber', 'timeStamp',
+        'input', 'type', 'gas', 'gasUsed', 'traceId',
+    )
+    hash: str
+    from_: str
+    to_: str
+    contractAddress: str
+    value: int
+    isError: bool
+    errCode: str
+    blockNumber: int
+    timeStamp: int
+    input: str
+    type: str
+    gas: int
+    gasUsed: int
+    traceId: str
+    _str_keys = ('hash', 'errCode', 'input', 'type', 'traceId')
+    _int_keys = (
+        'value', 'blockNumber', 'timeStamp', 'gas', 'gasUsed'
+    )
 
     def __init__(self, data: Dict[str, Any]) -> None:
         """
@@ -706,27 +974,51 @@ class InternalTx(AutoRepr, HistoryTx):
             data (Dict[str, Any]): the dictionary with an internal transaction data.
 
         """
-        self.hash: str = data.get('hash')
-        self.from_: str = checksum(data.get('from'))
-        self.to_: str = checksum(data.get('to'))
-        self.contractAddress: str = checksum(data.get('contractAddress')) if data.get('contractAddress') else ''
-        self.value: int = int(data.get('value'))
-        self.isError: bool = bool(data.get('isError'))
-        self.errCode: str = data.get('errCode')
-
-        self.blockNumber: int = int(data.get('blockNumber'))
-        self.timeStamp: int = int(data.get('timeStamp'))
-        self.input: str = data.get('input')
-        self.type: str = data.get('type')
-        self.gas: int = int(data.get('gas'))
-        self.gasUsed: int = int(data.get('gasUsed'))
-        self.traceId: str = data.get('traceId')
+        strs, ints = self._values(data)
+        self.hash, self.errCode, self.input, self.type, self.traceId = strs
+        (
+            self.value, self.blockNumber, self.timeStamp, self.gas, self.gasUsed
+        ) = ints
+        self.from_ = checksum(data.get('from'))
+        self.to_ = checksum(data.get('to'))
+        contract_address = data.get('contractAddress')
+        self.contractAddress = checksum(contract_address) if contract_address else ''
+        self.isError = bool(data.get('isError'))
 
 
-class ERC20Tx(AutoRepr, HistoryTx):
+class ERC20Tx(HistoryTx):
     """
     An instance of a ERC20 transaction.
     """
+    __slots__ = (
+        'hash', 'from_', 'to_', 'contractAddress', 'tokenName', 'tokenSymbol', 'tokenDecimal', 'value',
+        'blockNumber', 'timeStamp', 'nonce', 'blockHash', 'transactionIndex', 'gas', 'gasPrice', 'gasUsed',
+        'cumulativeGasUsed', 'input', 'confirmations',
+    )
+    hash: str
+    from_: str
+    to_: str
+    contractAddress: str
+    tokenName: str
+    tokenSymbol: str
+    tokenDecimal: int
+    value: int
+    blockNumber: int
+    timeStamp: int
+    nonce: int
+    blockHash: str
+    transactionIndex: int
+    gas: int
+    gasPrice: int
+    gasUsed: int
+    cumulativeGasUsed: int
+    input: str
+    confirmations: int
+    _str_keys = ('hash', 'tokenName', 'tokenSymbol', 'blockHash', 'input')
+    _int_keys = (
+        'tokenDecimal', 'value', 'blockNumber', 'timeStamp', 'nonce', 'transactionIndex', 'gas', 'gasPrice', 'gasUsed',
+        'cumulativeGasUsed', 'confirmations'
+    )
 
     def __init__(self, data: Dict[str, Any]) -> None:
         """
@@ -736,32 +1028,51 @@ class ERC20Tx(AutoRepr, HistoryTx):
             data (Dict[str, Any]): the dictionary with a ERC20 transaction data.
 
         """
-        self.hash: str = data.get('hash')
-        self.from_: str = checksum(data.get('from'))
-        self.to_: str = checksum(data.get('to'))
-        self.contractAddress: str = checksum(data.get('contractAddress')) if data.get('contractAddress') else ''
-        self.tokenName: str = data.get('tokenName')
-        self.tokenSymbol: str = data.get('tokenSymbol')
-        self.tokenDecimal: int = int(data.get('tokenDecimal'))
-        self.value: int = int(data.get('value'))
-
-        self.blockNumber: int = int(data.get('blockNumber'))
-        self.timeStamp: int = int(data.get('timeStamp'))
-        self.nonce: int = int(data.get('nonce'))
-        self.blockHash: str = data.get('blockHash')
-        self.transactionIndex: int = int(data.get('transactionIndex'))
-        self.gas: int = int(data.get('gas'))
-        self.gasPrice: int = int(data.get('gasPrice'))
-        self.gasUsed: int = int(data.get('gasUsed'))
-        self.cumulativeGasUsed: int = int(data.get('cumulativeGasUsed'))
-        self.input: str = data.get('input')
-        self.confirmations: int = int(data.get('confirmations'))
+        strs, ints = self._values(data)
+        self.hash, self.tokenName, self.tokenSymbol, self.blockHash, self.input = strs
+        (
+            self.tokenDecimal, self.value, self.blockNumber, self.timeStamp, self.nonce, self.transactionIndex,
+            self.gas, self.gasPrice, self.gasUsed, self.cumulativeGasUsed, self.confirmations
+        ) = ints
+        self.from_ = checksum(data.get('from'))
+        self.to_ = checksum(data.get('to'))
+        contract_address = data.get('contractAddress')
+        self.contractAddress = checksum(contract_address) if contract_address else ''
 
 
-class ERC721Tx(AutoRepr, HistoryTx):
+class ERC721Tx(HistoryTx):
     """
     An instance of a ERC721 transaction.
     """
+    __slots__ = (
+        'hash', 'from_', 'to_', 'contractAddress', 'tokenID', 'tokenName', 'tokenSymbol', 'tokenDecimal',
+        'blockNumber', 'timeStamp', 'nonce', 'blockHash', 'transactionIndex', 'gas', 'gasPrice', 'gasUsed',
+        'cumulativeGasUsed', 'input', 'confirmations',
+    )
+    hash: str
+    from_: str
+    to_: str
+    contractAddress: str
+    tokenID: int
+    tokenName: str
+    tokenSymbol: str
+    tokenDecimal: int
+    blockNumber: int
+    timeStamp: int
+    nonce: int
+    blockHash: str
+    transactionIndex: int
+    gas: int
+    gasPrice: int
+    gasUsed: int
+    cumulativeGasUsed: int
+    input: str
+    confirmations: int
+    _str_keys = ('hash', 'tokenName', 'tokenSymbol', 'blockHash', 'input')
+    _int_keys = (
+        'tokenID', 'tokenDecimal', 'blockNumber', 'timeStamp', 'nonce', 'transactionIndex', 'gas', 'gasPrice',
+        'gasUsed', 'cumulativeGasUsed', 'confirmations'
+    )
 
     def __init__(self, data: Dict[str, Any]) -> None:
         """
@@ -771,26 +1082,16 @@ class ERC721Tx(AutoRepr, HistoryTx):
             data (Dict[str, Any]): the dictionary with a ERC721 transaction data.
 
         """
-        self.hash: str = data.get('hash')
-        self.from_: str = checksum(data.get('from'))
-        self.to_: str = checksum(data.get('to'))
-        self.contractAddress: str = checksum(data.get('contractAddress')) if data.get('contractAddress') else ''
-        self.tokenID: int = int(data.get('tokenID'))
-        self.tokenName: str = data.get('tokenName')
-        self.tokenSymbol: str = data.get('tokenSymbol')
-        self.tokenDecimal: int = int(data.get('tokenDecimal'))
-
-        self.blockNumber: int = int(data.get('blockNumber'))
-        self.timeStamp: int = int(data.get('timeStamp'))
-        self.nonce: int = int(data.get('nonce'))
-        self.blockHash: str = data.get('blockHash')
-        self.transactionIndex: int = int(data.get('transactionIndex'))
-        self.gas: int = int(data.get('gas'))
-        self.gasPrice: int = int(data.get('gasPrice'))
-        self.gasUsed: int = int(data.get('gasUsed'))
-        self.cumulativeGasUsed: int = int(data.get('cumulativeGasUsed'))
-        self.input: str = data.get('input')
-        self.confirmations: int = int(data.get('confirmations'))
+        strs, ints = self._values(data)
+        self.hash, self.tokenName, self.tokenSymbol, self.blockHash, self.input = strs
+        (
+            self.tokenID, self.tokenDecimal, self.blockNumber, self.timeStamp, self.nonce, self.transactionIndex,
+            self.gas, self.gasPrice, self.gasUsed, self.cumulativeGasUsed, self.confirmations
+        ) = ints
+        self.from_ = checksum(data.get('from'))
+        self.to_ = checksum(data.get('to'))
+        contract_address = data.get('contractAddress')
+        self.contractAddress = checksum(contract_address) if contract_address else ''
 
 
 class RawTxHistory(AutoRepr):
@@ -844,6 +1145,7 @@ class Txs:
         all (Dict[str, HistoryTx]): a dictionary with all transactions.
 
     """
+    __slots__ = ('incoming', 'outgoing', 'all')
     incoming: Dict[str, HistoryTx]
     outgoing: Dict[str, HistoryTx]
     all: Dict[str, HistoryTx]
@@ -893,6 +1195,37 @@ class TxHistory(AutoRepr):
         self.parse_erc20_txs(txs=erc20_txs)
         self.parse_erc721_txs(txs=erc721_txs)
 
+    @staticmethod
+    def _partition(txs: list, tx_class: Type[HistoryTx], address: str) -> Txs:
+        """
+        Convert raw transactions to instances and split them into incoming and outgoing ones in a single pass.
+
+        Args:
+            txs (list): a list of raw transactions.
+            tx_class (Type[HistoryTx]): a class of transaction instances.
+            address (str): an address to which the history belongs.
+
+        Returns:
+            Txs: the transactions.
+
+        """
+        # Raw addresses are compared in lower case, it doesn't depend on the checksum of the instances
+        address = address.lower()
+        incoming = {}
+        outgoing = {}
+        all_txs = {}
+        for raw_tx in txs:
+            tx = tx_class(data=raw_tx)
+            tx_hash = tx.hash
+            all_txs[tx_hash] = tx
+            if (raw_tx.get('to') or '').lower() == address:
+                incoming[tx_hash] = tx
+
+            elif (raw_tx.get('from') or '').lower() == address:
+                outgoing[tx_hash] = tx
+
+        return Txs(incoming=incoming, outgoing=outgoing, all=all_txs)
+
     def parse_coin_txs(self, txs: Optional[list]) -> None:
         """
         Convert raw transactions with coin to instances.
@@ -904,15 +1237,7 @@ class TxHistory(AutoRepr):
         if not txs:
             return
 
-        self.coin = Txs(incoming={}, outgoing={}, all={})
-        for tx in txs:
-            tx = CoinTx(data=tx)
-            self.coin.all[tx.hash] = tx
-            if tx.to_ == self.address:
-                self.coin.incoming[tx.hash] = tx
-
-            elif tx.from_ == self.address:
-                self.coin.outgoing[tx.hash] = tx
+        self.coin = self._partition(txs=txs, tx_class=CoinTx, address=self.address)
 
     def parse_internal_txs(self, txs: Optional[list]) -> None:
         """
@@ -925,15 +1250,7 @@ class TxHistory(AutoRepr):
         if not txs:
             return
 
-        self.internal = Txs(incoming={}, outgoing={}, all={})
-        for tx in txs:
-            tx = InternalTx(data=tx)
-            self.internal.all[tx.hash] = tx
-            if tx.to_ == self.address:
-                self.internal.incoming[tx.hash] = tx
-
-            elif tx.from_ == self.address:
-                self.internal.outgoing[tx.hash] = tx
+        self.internal = self._partition(txs=txs, tx_class=InternalTx, address=self.address)
 
     def parse_erc20_txs(self, txs: Optional[list]) -> None:
         """
@@ -946,15 +1263,7 @@ class TxHistory(AutoRepr):
         if not txs:
             return
 
-        self.erc20 = Txs(incoming={}, outgoing={}, all={})
-        for tx in txs:
-            tx = ERC20Tx(data=tx)
-            self.erc20.all[tx.hash] = tx
-            if tx.to_ == self.address:
-                self.erc20.incoming[tx.hash] = tx
-
-            elif tx.from_ == self.address:
-                self.erc20.outgoing[tx.hash] = tx
+        self.erc20 = self._partition(txs=txs, tx_class=ERC20Tx, address=self.address)
 
     def parse_erc721_txs(self, txs: Optional[list]) -> None:
         """
@@ -967,15 +1276,7 @@ class TxHistory(AutoRepr):
         if not txs:
             return
 
-        self.erc721 = Txs(incoming={}, outgoing={}, all={})
-        for tx in txs:
-            tx = ERC721Tx(data=tx)
-            self.erc721.all[tx.hash] = tx
-            if tx.to_ == self.address:
-                self.erc721.incoming[tx.hash] = tx
-
-            elif tx.from_ == self.address:
-                self.erc721.outgoing[tx.hash] = tx
+        self.erc721 = self._partition(txs=txs, tx_class=ERC721Tx, address=self.address)
 
 
 class TxArgs(AutoRepr):
@@ -1028,8 +1329,55 @@ unit_denominations = {
     'tether': 10 ** 12,
 }
 
+# Powers of ten for the usual numbers of decimals, so they aren't computed for every amount
+_POW10_INT = {decimals: 10 ** decimals for decimals in range(40)}
+_POW10_DEC = {decimals: Decimal(power) for decimals, power in _POW10_INT.items()}
+_DEC_1E18 = _POW10_DEC[18]
+_MAX_WEI = 2 ** 256 - 1
+
 
-class Unit(AutoRepr):
+def _to_decimal(amount: Union[int, float, str, Decimal]) -> Decimal:
+    """
+    Convert an amount to a Decimal. Only floats are converted through a string, to keep their short representation.
+
+    Args:
+        amount (Union[int, float, str, Decimal]): the amount.
+
+    Returns:
+        Decimal: the amount.
+
+    """
+    if isinstance(amount, Decimal):
+        return amount
+
+    if isinstance(amount, float):
+        return Decimal(str(amount))
+
+    return Decimal(amount)
+
+
+def _wei_to_decimal(wei: int, exponent: int) -> Decimal:
+    """
+    Convert an integer amount to a Decimal with the exponent using integer arithmetic, the result is exact and looks
+    like the one of 'from_wei' from 'eth_utils'.
+
+    Args:
+        wei (int): the amount in the smallest unit.
+        exponent (int): the number of decimals.
+
+    Returns:
+        Decimal: the amount.
+
+    """
+    integer, fraction = divmod(abs(wei), _POW10_INT.get(exponent) or 10 ** exponent)
+    sign = '-' if wei < 0 else ''
+    if not fraction:
+        return Decimal(f'{sign}{integer}')
+
+    return Decimal(f'{sign}{integer}.' + f'{fraction:0{exponent}d}'.rstrip('0'))
+
+
+class Unit:
     """
     An instance of an Ethereum unit.
 
@@ -1049,19 +1397,23 @@ class Unit(AutoRepr):
         TEther (Decimal): the amount in TEther.
 
     """
+    __slots__ = ('unit', 'decimals', 'Wei')
     unit: str
     decimals: int
     Wei: int
-    KWei: Decimal
-    MWei: Decimal
-    GWei: Decimal
-    Szabo: Decimal
-    Finney: Decimal
-    Ether: Decimal
-    KEther: Decimal
-    MEther: Decimal
-    GEther: Decimal
-    TEther: Decimal
+
+    _EXPONENTS: Dict[str, int] = {
+        'KWei': 3,
+        'MWei': 6,
+        'GWei': 9,
+        'Szabo': 12,
+        'Finney': 15,
+        'Ether': 18,
+        'KEther': 21,
+        'MEther': 24,
+        'GEther': 27,
+        'TEther': 30,
+    }
 
     def __init__(self, amount: Union[int, float, str, Decimal], unit: str) -> None:
         """
@@ -1075,16 +1427,116 @@ class Unit(AutoRepr):
         self.unit = unit
         self.decimals = 18
         self.Wei = to_wei(amount, self.unit)
-        self.KWei = from_wei(self.Wei, 'kwei')
-        self.MWei = from_wei(self.Wei, 'mwei')
-        self.GWei = from_wei(self.Wei, 'gwei')
-        self.Szabo = from_wei(self.Wei, 'szabo')
-        self.Finney = from_wei(self.Wei, 'finney')
-        self.Ether = from_wei(self.Wei, 'ether')
-        self.KEther = from_wei(self.Wei, 'kether')
-        self.MEther = from_wei(self.Wei, 'mether')
-        self.GEther = from_wei(self.Wei, 'gether')
-        self.TEther = from_wei(self.Wei, 'tether')
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def cached(cls, amount: Union[int, float, str, Decimal]) -> Unit:
+        """
+        Get a shared instance of a unit subclass for the amount, e.g. Wei.cached(21000). It's useful for amounts that
+        are created over and over again, the instance mustn't be modified.
+
+        Args:
+            amount (Union[int, float, str, Decimal]): an amount.
+
+        Returns:
+            Unit: the shared instance.
+
+        """
+        return cls(amount)
+
+    @classmethod
+    def _new(cls, wei: int, unit: str) -> Unit:
+        """
+        Create an instance from the amount in Wei without converting it.
+
+        Args:
+            wei (int): the amount in Wei.
+            unit (str): a unit name.
+
+        Returns:
+            Unit: the instance.
+
+        """
+        if not 0 <= wei <= _MAX_WEI:
+            raise ValueError('Resulting wei value must be between 1 and 2**256 - 1')
+
+        instance = cls.__new__(cls)
+        instance.unit = unit
+        instance.decimals = 18
+        instance.Wei = wei
+        return instance
+
+    def __repr__(self) -> str:
+        values = ['unit={!r}'.format(self.unit), 'decimals={!r}'.format(self.decimals)]
+        values += ('{}={!r}'.format(key, value) for key, value in self.as_dict().items())
+        return '{}({})'.format(self.__class__.__name__, ', '.join(values))
+
+    def _from_wei(self, unit: str) -> Decimal:
+        """
+        Convert the amount in Wei to the unit.
+
+        Args:
+            unit (str): a unit attribute name.
+
+        Returns:
+            Decimal: the amount in the unit.
+
+        """
+        return _wei_to_decimal(self.Wei, self._EXPONENTS[unit])
+
+    def as_dict(self) -> Dict[str, Union[int, Decimal]]:
+        """
+        Get the amount in all units at once.
+
+        Returns:
+            Dict[str, Union[int, Decimal]]: the dictionary with units and amounts.
+
+        """
+        amounts = {'Wei': self.Wei}
+        for unit, exponent in self._EXPONENTS.items():
+            amounts[unit] = _wei_to_decimal(self.Wei, exponent)
+
+        return amounts
+
+    @property
+    def KWei(self) -> Decimal:
+        return self._from_wei('KWei')
+
+    @property
+    def MWei(self) -> Decimal:
+        return self._from_wei('MWei')
+
+    @property
+    def GWei(self) -> Decimal:
+        return self._from_wei('GWei')
+
+    @property
+    def Szabo(self) -> Decimal:
+        return self._from_wei('Szabo')
+
+    @property
+    def Finney(self) -> Decimal:
+        return self._from_wei('Finney')
+
+    @property
+    def Ether(self) -> Decimal:
+        return self._from_wei('Ether')
+
+    @property
+    def KEther(self) -> Decimal:
+        return self._from_wei('KEther')
+
+    @property
+    def MEther(self) -> Decimal:
+        return self._from_wei('MEther')
+
+    @property
+    def GEther(self) -> Decimal:
+        return self._from_wei('GEther')
+
+    @property
+    def TEther(self) -> Decimal:
+        return self._from_wei('TEther')
 
     def __add__(self, other):
         if isinstance(other, (Unit, TokenAmount)):
@@ -1174,13 +1626,13 @@ class Unit(AutoRepr):
             if self.unit != 'ether':
                 raise ArithmeticError('You can only perform this action with an Ether unit!')
 
-            return Ether(Decimal(str(self.Ether)) * Decimal(str(other.Ether)))
+            return Ether(_to_decimal(self.Ether) * _to_decimal(other.Ether))
 
         if isinstance(other, Unit):
             if isinstance(other, Unit) and self.unit != other.unit:
                 raise ArithmeticError('The units are different!')
 
-            denominations = int(Decimal(str(unit_denominations[self.unit])) * Decimal(str(10 ** self.decimals)))
+            denominations = int(_to_decimal(unit_denominations[self.unit]) * _to_decimal(10 ** self.decimals))
             return Wei(self.Wei * other.Wei / denominations)
 
         elif isinstance(other, int):
@@ -1204,13 +1656,13 @@ class Unit(AutoRepr):
             if self.unit != 'ether':
                 raise ArithmeticError('You can only perform this action with an Ether unit!')
 
-            return Ether(Decimal(str(other.Ether)) * Decimal(str(self.Ether)))
+            return Ether(_to_decimal(other.Ether) * _to_decimal(self.Ether))
 
         if isinstance(other, Unit):
             if isinstance(other, Unit) and self.unit != other.unit:
                 raise ArithmeticError('The units are different!')
 
-            denominations = int(Decimal(str(unit_denominations[self.unit])) * Decimal(str(10 ** self.decimals)))
+            denominations = int(_to_decimal(unit_denominations[self.unit]) * _to_decimal(10 ** self.decimals))
             return Wei(other.Wei * self.Wei / denominations)
 
         elif isinstance(other, int):
@@ -1234,17 +1686,17 @@ class Unit(AutoRepr):
             if self.unit != 'ether':
                 raise ArithmeticError('You can only perform this action with an Ether unit!')
 
-            return Ether(Decimal(str(self.Ether)) / Decimal(str(other.Ether)))
+            return Ether(_to_decimal(self.Ether) / _to_decimal(other.Ether))
 
         if isinstance(other, Unit):
             if isinstance(other, Unit) and self.unit != other.unit:
                 raise ArithmeticError('The units are different!')
 
-            denominations = int(Decimal(str(unit_denominations[self.unit])) * Decimal(str(10 ** self.decimals)))
+            denominations = int(_to_decimal(unit_denominations[self.unit]) * _to_decimal(10 ** self.decimals))
             return Wei(self.Wei / other.Wei * denominations)
 
         elif isinstance(other, int):
-            return Wei(self.Wei / Decimal(str(other)))
+            return Wei(self.Wei / _to_decimal(other))
 
         elif isinstance(other, float):
             if self.unit == 'gwei':
@@ -1264,17 +1716,17 @@ class Unit(AutoRepr):
             if self.unit != 'ether':
                 raise ArithmeticError('You can only perform this action with an Ether unit!')
 
-            return Ether(Decimal(str(other.Ether)) / Decimal(str(self.Ether)))
+            return Ether(_to_decimal(other.Ether) / _to_decimal(self.Ether))
 
         if isinstance(other, Unit):
             if isinstance(other, Unit) and self.unit != other.unit:
                 raise ArithmeticError('The units are different!')
 
-            denominations = int(Decimal(str(unit_denominations[self.unit])) * Decimal(str(10 ** self.decimals)))
+            denominations = int(_to_decimal(unit_denominations[self.unit]) * _to_decimal(10 ** self.decimals))
             return Wei(other.Wei / self.Wei * denominations)
 
         elif isinstance(other, int):
-            return Wei(Decimal(str(other)) / self.Wei)
+            return Wei(_to_decimal(other) / self.Wei)
 
         elif isinstance(other, float):
             if self.unit == 'gwei':
@@ -1423,6 +1875,7 @@ class Wei(Unit):
     """
     An instance of a Wei unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1434,11 +1887,29 @@ class Wei(Unit):
         """
         super().__init__(amount, 'wei')
 
+    @classmethod
+    def from_gwei(cls, amount: Union[int, float, str, Decimal]) -> Wei:
+        """
+        Create an instance from an amount in GWei, an integer amount is converted without Decimal arithmetic.
+
+        Args:
+            amount (Union[int, float, str, Decimal]): an amount in GWei.
+
+        Returns:
+            Wei: the instance.
+
+        """
+        if type(amount) is int:
+            return cls._new(amount * 1_000_000_000, 'wei')
+
+        return cls._new(to_wei(amount, 'gwei'), 'wei')
+
 
 class KWei(Unit):
     """
     An instance of a KWei unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1455,6 +1926,7 @@ class MWei(Unit):
     """
     An instance of a MWei unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1471,6 +1943,7 @@ class GWei(Unit):
     """
     An instance of a GWei unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1487,6 +1960,7 @@ class Szabo(Unit):
     """
     An instance of a Szabo unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1503,6 +1977,7 @@ class Finney(Unit):
     """
     An instance of a Finney unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1519,6 +1994,7 @@ class Ether(Unit):
     """
     An instance of an Ether unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1530,11 +2006,29 @@ class Ether(Unit):
         """
         super().__init__(amount, 'ether')
 
+    @classmethod
+    def from_wei(cls, amount: Union[int, float, str, Decimal]) -> Ether:
+        """
+        Create an instance from an amount in Wei, an integer amount is used as is.
+
+        Args:
+            amount (Union[int, float, str, Decimal]): an amount in Wei.
+
+        Returns:
+            Ether: the instance.
+
+        """
+        if type(amount) is int:
+            return cls._new(amount, 'ether')
+
+        return cls._new(to_wei(amount, 'wei'), 'ether')
+
 
 class KEther(Unit):
     """
     An instance of a KEther unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1551,6 +2045,7 @@ class MEther(Unit):
     """
     An instance of a MEther unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1567,6 +2062,7 @@ class GEther(Unit):
     """
     An instance of a GEther unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1583,6 +2079,7 @@ class TEther(Unit):
     """
     An instance of a TEther unit.
     """
+    __slots__ = ()
 
     def __init__(self, amount: Union[int, float, str, Decimal]) -> None:
         """
@@ -1595,7 +2092,7 @@ class TEther(Unit):
         super().__init__(amount, 'tether')
 
 
-class TokenAmount(AutoRepr):
+class TokenAmount(SlotsRepr):
     """
     An instance of a token amount.
 
@@ -1605,9 +2102,10 @@ class TokenAmount(AutoRepr):
         Ether (Decimal): the amount in Ether.
 
     """
+    __slots__ = ('Wei', 'decimals', '_ether')
+    _repr_fields = ('Wei', 'Ether', 'decimals')
     decimals: int
     Wei: int
-    Ether: Decimal
 
     def __init__(self, amount: Union[int, float, str, Decimal], decimals: int = 18, wei: bool = False) -> None:
         """
@@ -1621,14 +2119,75 @@ class TokenAmount(AutoRepr):
         """
         if wei:
             self.Wei = amount
-            self.Ether = Decimal(str(amount)) / 10 ** decimals
+            # Ether of an integer amount, e.g. a balance, is calculated on the first access
+            self._ether = None
+            if not isinstance(amount, int):
+                power = _DEC_1E18 if decimals == 18 else (_POW10_DEC.get(decimals) or Decimal(10 ** decimals))
+                self._ether = _to_decimal(amount) / power
 
         else:
-            self.Wei = int(Decimal(str(amount)) * 10 ** decimals)
-            self.Ether = Decimal(str(amount))
+            power = _DEC_1E18 if decimals == 18 else (_POW10_DEC.get(decimals) or Decimal(10 ** decimals))
+            self._ether = _to_decimal(amount)
+            self.Wei = int(self._ether * power)
 
         self.decimals = decimals
 
+    @classmethod
+    def from_hex(cls, amount: str, decimals: int = 18) -> TokenAmount:
+        """
+        Create an instance from a hex amount in Wei, e.g. a raw result of an 'eth_call' request.
+
+        Args:
+            amount (str): the hex amount in Wei, with or without the '0x' prefix.
+            decimals (int): the number of decimals of the token. (18)
+
+        Returns:
+            TokenAmount: the instance, its Ether is calculated on the first access.
+
+        """
+        token_amount = cls.__new__(cls)
+        token_amount.Wei = int(amount, 16)
+        token_amount.decimals = decimals
+        token_amount._ether = None
+        return token_amount
+
+    @classmethod
+    def from_wei_array(cls, amounts: Iterable[int], decimals: int = 18) -> List[TokenAmount]:
+        """
+        Create instances for many amounts in Wei at once, e.g. balances returned by a multicall.
+
+        Args:
+            amounts (Iterable[int]): amounts in Wei, any integer-like values including NumPy ones.
+            decimals (int): the number of decimals of the token. (18)
+
+        Returns:
+            List[TokenAmount]: the instances, their Ether is calculated on the first access.
+
+        """
+        new = cls.__new__
+        token_amounts = []
+        for amount in amounts:
+            token_amount = new(cls)
+            token_amount.Wei = int(amount)
+            token_amount.decimals = decimals
+            token_amount._ether = None
+            token_amounts.append(token_amount)
+
+        return token_amounts
+
+    @property
+    def Ether(self) -> Decimal:
+        if self._ether is None:
+            decimals = self.decimals
+            power = _DEC_1E18 if decimals == 18 else (_POW10_DEC.get(decimals) or Decimal(10 ** decimals))
+            self._ether = Decimal(self.Wei) / power
+
+        return self._ether
+
+    @Ether.setter
+    def Ether(self, value: Decimal) -> None:
+        self._ether = value
+
     def change_decimals(self, new_decimals: int) -> int:
         """
         Leave the Ether amount and change the Wei based on the new decimals.
@@ -1640,7 +2199,24 @@ class TokenAmount(AutoRepr):
             int: the amount in Wei.
 
         """
-        self.Wei: int = int(self.Ether * 10 ** new_decimals)
+        if self._ether is not None:
+            self.Wei = int(self._ether * (_POW10_DEC.get(new_decimals) or Decimal(10 ** new_decimals)))
+
+        else:
+            # The Ether is exactly Wei / 10 ** decimals here, so the Wei is rescaled as an integer
+            diff = new_decimals - self.decimals
+            if diff >= 0:
+                self.Wei *= _POW10_INT.get(diff) or 10 ** diff
+
+            else:
+                # Truncate towards zero like int() does
+                wei, remainder = divmod(abs(self.Wei), _POW10_INT.get(-diff) or 10 ** -diff)
+                if remainder:
+                    # Keep the Ether amount that can't be represented with the new decimals
+                    self._ether = Decimal(self.Wei) / (_POW10_DEC.get(self.decimals) or Decimal(10 ** self.decimals))
+
+                self.Wei = wei if self.Wei >= 0 else -wei
+
         self.decimals = new_decimals
         return self.Wei
 
@@ -1879,3 +2455,22 @@ class TokenAmount(AutoRepr):
 
         else:
             raise ArithmeticError(f"{type(other)} type isn't supported!")
+
+
+def amount_to_wei(amount: Union[int, float, str, Decimal, Unit, TokenAmount], decimals: int = 18) -> int:
+    """
+    Get an amount in Wei without creating an intermediate instance.
+
+    Args:
+        amount (Union[int, float, str, Decimal, Unit, TokenAmount]): a number of tokens or an instance that already
+            contains the amount in Wei.
+        decimals (int): the number of decimals of the token, it's only used for numbers. (18)
+
+    Returns:
+        int: the amount in Wei.
+
+    """
+    if isinstance(amount, (int, float, str, Decimal)):
+        return int(_to_decimal(amount) * (_POW10_DEC.get(decimals) or Decimal(10 ** decimals)))
+
+    return amount.Wei
@@ -2,58 +2,60 @@ from typing import Optional, Dict, Any
 
 
 class ClientException(Exception):
-    pass
+    __slots__ = ()
 
 
 class InvalidProxy(ClientException):
-    pass
+    __slots__ = ()
 
 
 class APIException(Exception):
-    pass
+    __slots__ = ()
 
 
 class ContractException(Exception):
-    pass
+    __slots__ = ()
 
 
 class NFTException(Exception):
-    pass
+    __slots__ = ()
 
 
 class TransactionException(Exception):
-    pass
+    __slots__ = ()
 
 
 class NoSuchToken(TransactionException):
-    pass
+    __slots__ = ()
 
 
 class InsufficientBalance(TransactionException):
-    pass
+    __slots__ = ()
 
 
 class GasPriceTooHigh(TransactionException):
-    pass
+    __slots__ = ()
 
 
 class FailedToApprove(TransactionException):
-    pass
+    __slots__ = ()
 
 
 class WalletException(Exception):
-    pass
+    __slots__ = ()
 
 
 class HTTPException(Exception):
     """
-    An exception that occurs when an HTTP request is unsuccessful.
+    An exception that occurs when an HTTP request is unsuccessful. The message is built once on initialization, so
+    changing the attributes afterwards doesn't change it.
 
     Attributes:
         response (Optional[Dict[str, Any]]): a JSON response to a request.
         status_code (Optional[int]): a request status code.
 
     """
+    __slots__ = ('response', 'status_code', '_msg')
     response: Optional[Dict[str, Any]]
     status_code: Optional[int]
 
@@ -68,9 +70,11 @@ class HTTPException(Exception):
         """
         self.response = response
         self.status_code = status_code
-
-    def __str__(self):
         if self.response:
-            return f'{self.status_code}: {self.response}'
+            self._msg = f'{self.status_code}: {self.response}'
 
-        return f'{self.status_code}'
+        else:
+            self._msg = f'{self.status_code}'
+
+    def __str__(self):
+        return self._msg
@@ -1,11 +1,150 @@
-import json
-from typing import Union
-from urllib.request import urlopen
+from __future__ import annotations
+
+import asyncio
+import base64
+import time
+from collections import OrderedDict
+from typing import Union, Optional, Tuple, List, Any, Set
+from urllib.parse import unquote_to_bytes
+
+import aiohttp
+from eth_abi import decode
+from eth_abi.exceptions import DecodingError
+from web3.exceptions import ContractLogicError, BadFunctionCallOutput, Web3Exception
 
 from py_eth_async import exceptions
+from py_eth_async.contracts import MULTICALL3_ADDRESS
 from py_eth_async.data import types
 from py_eth_async.data.models import NFT
-from py_eth_async.utils import async_get
+from py_eth_async.utils import async_get, json_loads, checksum
+
+
+# (RPC, contract address) -> name and symbol of a collection, they don't change
+_collections: OrderedDict[Tuple[str, str], Tuple[str, str]] = OrderedDict()
+# (RPC, contract address) -> when the total supply was requested and the total supply
+_total_supplies: OrderedDict[Tuple[str, str], Tuple[float, int]] = OrderedDict()
+_TOTAL_SUPPLY_TTL = 10
+# The maximum number of collections in each of the caches above, the least recently used ones are dropped
+_COLLECTIONS_CACHE_SIZE = 1000
+# RPCs of networks where Multicall3 calls failed
+_no_multicall: Set[str] = set()
+# For how many seconds a response from one of several IPFS gateways is waited for
+_IPFS_TIMEOUT = 10
+# The maximum number of calls in one Multicall3 request
+_MULTICALL_SIZE = 500
+# Selectors of the ERC-721 view functions, calldata is built from them without parsing the ABI
+_NAME = bytes.fromhex('06fdde03')  # name()
+_SYMBOL = bytes.fromhex('95d89b41')  # symbol()
+_TOTAL_SUPPLY = bytes.fromhex('18160ddd')  # totalSupply()
+_OWNER_OF = bytes.fromhex('6352211e')  # ownerOf(uint256)
+_TOKEN_URI = bytes.fromhex('c87b56dd')  # tokenURI(uint256)
+# Errors of getting the token URI and downloading the metadata that leave the NFT without attributes. ValueError covers
+# invalid JSON, base64 and RPC errors
+_METADATA_ERRORS = (
+    Web3Exception, DecodingError, aiohttp.ClientError, asyncio.TimeoutError, exceptions.HTTPException, ValueError
+)
+
+
+def _remember(cache: OrderedDict, key: Tuple[str, str], value: Any) -> None:
+    """
+    Put a value into a collection cache evicting the least recently used one if the cache is full.
+
+    Args:
+        cache (OrderedDict): the cache.
+        key (Tuple[str, str]): the RPC and the contract address.
+        value (Any): the value.
+
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _COLLECTIONS_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _data_uri_payload(uri: str) -> bytes:
+    """
+    Decode the payload of a data URI in place instead of opening it as a URL.
+
+    Args:
+        uri (str): the data URI.
+
+    Returns:
+        bytes: the payload.
+
+    """
+    header, _, data = uri.partition(',')
+    if ';base64' in header:
+        return base64.b64decode(data)
+
+    return unquote_to_bytes(data)
+
+
+async def _get_first(urls: List[str], timeout: float, session: aiohttp.ClientSession) -> Optional[dict]:
+    """
+    Request several URLs with the same content at once and return the first successful response.
+
+    Args:
+        urls (List[str]): the URLs.
+        timeout (float): how many seconds to wait for a successful response.
+        session (aiohttp.ClientSession): the session to make the requests with.
+
+    Returns:
+        Optional[dict]: received dictionary in response.
+
+    """
+    tasks = [asyncio.ensure_future(async_get(url, session=session)) for url in urls]
+    pending = set(tasks)
+    deadline = time.monotonic() + timeout
+    error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=deadline - time.monotonic(), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                raise asyncio.TimeoutError()
+
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+
+                error = task.exception()
+
+        raise error
+
+    finally:
+        for task in tasks:
+            if task.done():
+                if not task.cancelled():
+                    task.exception()
+
+            else:
+                task.cancel()
+
+
+def _decode_result(function_name: str, return_type: str, success: bool, data: bytes) -> Any:
+    """
+    Decode the value returned by a view function.
+
+    Args:
+        function_name (str): the function name.
+        return_type (str): the return type.
+        success (bool): whether the call succeeded.
+        data (bytes): the returned data.
+
+    Returns:
+        Any: the value, or an exception if the call reverted or the data can't be decoded.
+
+    """
+    try:
+        if not success:
+            raise ContractLogicError(f"The '{function_name}' call reverted")
+
+        value = decode([return_type], data)[0]
+        return checksum(value) if return_type == 'address' else value
+
+    except Exception as e:
+        return e
 
 
 class NFTs:
@@ -16,6 +155,7 @@ class NFTs:
         client (Client): the Client instance.
 
     """
+    __slots__ = ('client',)
 
     def __init__(self, client) -> None:
         """
@@ -27,52 +167,242 @@ class NFTs:
         """
         self.client = client
 
-    async def get_info(self, contract: types.Contract, token_id: Union[int, str] = None) -> NFT:
+    async def get_info(
+            self, contract: types.Contract, token_id: Union[int, str] = None, fetch_owner: bool = True,
+            fetch_attributes: bool = True
+    ) -> NFT:
         """
         Get information about a NFT.
 
         Args:
             contract (Contract): the contract address or instance of a NFT collection.
             token_id (Union[int, str]): the NFT ID to parse the owner and attributes. (None)
+            fetch_owner (bool): whether to get the owner of the NFT. (True)
+            fetch_attributes (bool): whether to download the NFT metadata and parse the attributes. (True)
 
         Returns:
             NFT: the NFT.
 
+        """
+        return (await self.get_infos(
+            contract=contract, token_ids=[token_id], fetch_owner=fetch_owner, fetch_attributes=fetch_attributes
+        ))[0]
+
+    async def get_infos(
+            self, contract: types.Contract, token_ids: List[Union[int, str]], fetch_owner: bool = True,
+            fetch_attributes: bool = True, concurrency: int = 20
+    ) -> List[NFT]:
+        """
+        Get information about several NFTs of a collection. Contract calls are made in Multicall3 batches and metadata
+            is downloaded concurrently.
+
+        Args:
+            contract (Contract): the contract address or instance of a NFT collection.
+            token_ids (List[Union[int, str]]): the NFT IDs to parse the owners and attributes.
+            fetch_owner (bool): whether to get the owners of the NFTs. (True)
+            fetch_attributes (bool): whether to download the NFT metadata and parse the attributes. (True)
+            concurrency (int): the maximum number of metadata downloads at once. (20)
+
+        Returns:
+            List[NFT]: the NFTs in the order of the IDs.
+
         """
         contract_address, abi = await self.client.contracts.get_contract_attributes(contract)
-        contract = await self.client.contracts.default_nft(contract_address)
-        nft = NFT(contract_address=contract_address)
-        nft.name = await contract.functions.name().call()
-        nft.symbol = await contract.functions.symbol().call()
-        nft.total_supply = await contract.functions.totalSupply().call()
-        if token_id:
-            try:
-                token_id = int(token_id)
-                if token_id >= nft.total_supply:
-                    exceptions.NFTException('The token ID exceeds total supply!')
+        key = (self.client.network.rpc, contract_address)
+        collection = _collections.get(key)
+        if collection is not None:
+            _collections.move_to_end(key)
 
-                nft.id = token_id
+        total_supply = _total_supplies.pop(key, None)
+        if total_supply and total_supply[0] + _TOTAL_SUPPLY_TTL > time.monotonic():
+            # Put back as the most recently used, an expired one stays removed
+            _total_supplies[key] = total_supply
+            total_supply = total_supply[1]
+
+        else:
+            total_supply = None
+
+        calls = []
+        if collection is None:
+            calls += [('name', _NAME, 'string'), ('symbol', _SYMBOL, 'string')]
+
+        if total_supply is None:
+            calls.append(('totalSupply', _TOTAL_SUPPLY, 'uint256'))
+
+        parsed_ids = []
+        for token_id in token_ids:
+            if token_id is not None:
                 try:
-                    nft.owner = await contract.functions.ownerOf(token_id).call()
-                except:
-                    pass
+                    token_id = int(token_id)
+
+                except (TypeError, ValueError):
+                    token_id = None
+
+                if token_id is not None and not 0 <= token_id < 2 ** 256:
+                    token_id = None
+
+            parsed_ids.append(token_id)
+
+        for token_id in parsed_ids:
+            if token_id is not None:
+                token_id_bytes = token_id.to_bytes(32, 'big')
+                if fetch_owner:
+                    calls.append(('ownerOf', _OWNER_OF + token_id_bytes, 'address'))
+
+                calls.append(('tokenURI', _TOKEN_URI + token_id_bytes, 'string'))
+
+        results = []
+        for i in range(0, len(calls), _MULTICALL_SIZE):
+            results += await self._call_all(contract_address, calls[i:i + _MULTICALL_SIZE])
+
+        results = iter(results)
+        if collection is None:
+            collection = (next(results), next(results))
+
+        if total_supply is None:
+            total_supply = next(results)
+
+        for value in (*collection, total_supply):
+            if isinstance(value, BaseException):
+                raise value
+
+        _remember(_collections, key, collection)
+        _remember(_total_supplies, key, (time.monotonic(), total_supply))
+        nfts = []
+        token_uris = []
+        for token_id in parsed_ids:
+            nft = NFT(contract_address=contract_address)
+            nft.name, nft.symbol = collection
+            nft.total_supply = total_supply
+            if token_id is not None:
+                nft.id = token_id
+                owner = next(results) if fetch_owner else None
+                if owner is not None and not isinstance(owner, BaseException):
+                    nft.owner = owner
+
+                token_uris.append((nft, next(results)))
+
+            nfts.append(nft)
+
+        if token_uris:
+            # Metadata is downloaded with one session, the semaphore limits the number of downloads at once
+            semaphore = asyncio.Semaphore(concurrency)
+            async with aiohttp.ClientSession() as session:
+                await asyncio.gather(*(
+                    self._parse_metadata(nft, token_uri, fetch_attributes, session, semaphore)
+                    for nft, token_uri in token_uris
+                ))
+
+        return nfts
+
+    async def _parse_metadata(
+            self, nft: NFT, token_uri: Union[str, BaseException], fetch_attributes: bool,
+            session: aiohttp.ClientSession, semaphore: asyncio.Semaphore
+    ) -> None:
+        """
+        Parse the image URL and the attributes of a NFT from its token URI.
 
-                image_url = await contract.functions.tokenURI(token_id).call()
-                if 'data:application/json' in image_url:
-                    with urlopen(image_url) as response:
-                        response = json.loads(response.read())
+        Args:
+            nft (NFT): the NFT.
+            token_uri (Union[str, BaseException]): the token URI or an error of getting it.
+            fetch_attributes (bool): whether to download the NFT metadata and parse the attributes.
+            session (aiohttp.ClientSession): the session to download the metadata with.
+            semaphore (asyncio.Semaphore): the semaphore limiting the number of metadata downloads.
+
+        """
+        try:
+            if isinstance(token_uri, BaseException):
+                raise token_uri
+
+            if 'data:application/json' in token_uri:
+                if not fetch_attributes:
+                    return
+
+                response = json_loads(_data_uri_payload(token_uri))
+
+            elif token_uri.startswith('ipfs://'):
+                path = token_uri[7:]
+                nft.image_url = self.client.ipfs_gateway + path
+                if not fetch_attributes:
+                    return
+
+                gateways = list(dict.fromkeys([self.client.ipfs_gateway, *self.client.ipfs_fallback_gateways]))
+                async with semaphore:
+                    if len(gateways) > 1:
+                        response = await _get_first(
+                            [gateway + path for gateway in gateways], _IPFS_TIMEOUT, session
+                        )
+
+                    else:
+                        response = await async_get(nft.image_url, session=session)
+
+            else:
+                nft.image_url = token_uri
+                if not fetch_attributes:
+                    return
+
+                async with semaphore:
+                    response = await async_get(token_uri, session=session)
+
+            attributes = response.get('attributes') if isinstance(response, dict) else None
+            if isinstance(attributes, list):
+                # Attributes need a value and a name, that is either 'trait_type' or another key
+                nft.parse_attributes([
+                    attribute for attribute in attributes
+                    if isinstance(attribute, dict) and 'value' in attribute and len(attribute) > 1
+                ])
+
+        except _METADATA_ERRORS:
+            pass
 
-                else:
-                    if 'ipfs://' in image_url:
-                        image_url = image_url.replace('ipfs://', 'https://ipfs.io/ipfs/')
+    async def _call_all(self, contract_address: str, calls: List[Tuple[str, bytes, str]]) -> List[Any]:
+        """
+        Call view functions of a contract in one Multicall3 request, or in concurrent requests if the network doesn't
+        have Multicall3.
+
+        Args:
+            contract_address (str): the contract address.
+            calls (List[Tuple[str, bytes, str]]): function names, their calldata and return types.
+
+        Returns:
+            List[Any]: the returned values, or exceptions for the calls that failed.
+
+        """
+        rpc = self.client.network.rpc
+        if len(calls) > 1 and rpc not in _no_multicall:
+            try:
+                responses = await self.client.contracts.default_multicall().functions.aggregate3(
+                    [(contract_address, True, data) for _, data, _ in calls]
+                ).call()
+
+            except ContractLogicError:
+                _no_multicall.add(rpc)
 
-                    nft.image_url = image_url
-                    response = await async_get(image_url)
+            except BadFunctionCallOutput:
+                # Empty output means there is no Multicall3 contract on the network
+                try:
+                    if not await self.client.w3.eth.get_code(MULTICALL3_ADDRESS):
+                        _no_multicall.add(rpc)
 
-                if 'attributes' in response and response['attributes']:
-                    nft.parse_attributes(response['attributes'])
+                except Exception:
+                    pass
 
-            except:
+            except Exception:
+                # Transport errors are transient, so the calls are made without Multicall3 only this time
                 pass
 
-        return nft
+            else:
+                return [
+                    _decode_result(function_name, return_type, success, data)
+                    for (function_name, _, return_type), (success, data) in zip(calls, responses)
+                ]
+
+        responses = await asyncio.gather(
+            *(self.client.w3.eth.call({'to': contract_address, 'data': data}) for _, data, _ in calls),
+            return_exceptions=True
+        )
+        return [
+            response if isinstance(response, BaseException)
+            else _decode_result(function_name, return_type, True, response)
+            for (function_name, _, return_type), response in zip(calls, responses)
+        ]
@@ -1,3 +1,9 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+import weakref
 from typing import Union, Optional, Dict, Any, Tuple, List
 
 from eth_account.datastructures import SignedTransaction, SignedMessage
@@ -10,11 +16,15 @@ from web3.types import TxReceipt, _Hash32, TxParams, Address
 from py_eth_async import exceptions
 from py_eth_async.data import types
 from py_eth_async.data.models import (
-    TxHistory, RawTxHistory, GWei, Wei, Ether, TokenAmount, CommonValues, CoinTx, TxArgs
+    TxHistory, RawTxHistory, GWei, Wei, Ether, TokenAmount, CommonValues, CoinTx, TxArgs, amount_to_wei
 )
 from py_eth_async.data.types import Web3Async
 from py_eth_async.utils import api_key_required, checksum
 
+# Web3 instance -> when the gas price was requested and the gas price
+_gas_prices: weakref.WeakKeyDictionary[Web3Async, Tuple[float, Wei]] = weakref.WeakKeyDictionary()
+_GAS_PRICE_TTL = 2
+
 
 class Tx(AutoRepr):
     """
@@ -145,10 +155,10 @@ class Tx(AutoRepr):
         """
         if self.params and 'nonce' in self.params:
             if not gas_price:
-                gas_price = (await Transactions.gas_price(w3=client.w3)).Wei
+                gas_price = (await Transactions.gas_price(w3=client.w3, fresh=True)).Wei
 
             elif isinstance(gas_price, (int, float)):
-                gas_price = GWei(gas_price).Wei
+                gas_price = GWei.cached(gas_price).Wei
 
             if gas_price < self.params.get('gasPrice') * 1.11:
                 gas_price = int(self.params.get('gasPrice') * 1.11)
@@ -170,16 +180,14 @@ class Tx(AutoRepr):
                 gas_limit = await Transactions.estimate_gas(w3=client.w3, tx_params=tx_params)
 
             elif isinstance(gas_limit, int):
-                gas_limit = Wei(gas_limit)
+                gas_limit = Wei.cached(gas_limit)
 
             tx_params['gas'] = gas_limit.Wei
-            signed_tx = client.w3.eth.account.sign_transaction(
-                transaction_dict=tx_params, private_key=client.account.key
-            )
+            signed_tx = await client.transactions.sign_transaction(tx_params)
             tx_hash = await client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
             if tx_hash:
                 self.hash = tx_hash
-                self.params = tx_params.copy()
+                self.params = tx_params
                 return True
 
         return False
@@ -201,10 +209,10 @@ class Tx(AutoRepr):
         """
         if self.params and 'nonce' in self.params:
             if not gas_price:
-                gas_price = int((await Transactions.gas_price(w3=client.w3)).Wei * 1.5)
+                gas_price = int((await Transactions.gas_price(w3=client.w3, fresh=True)).Wei * 1.5)
 
             elif isinstance(gas_price, (int, float)):
-                gas_price = GWei(gas_price).Wei
+                gas_price = GWei.cached(gas_price).Wei
 
             tx_params = self.params.copy()
             if client.network.tx_type == 2:
@@ -218,16 +226,14 @@ class Tx(AutoRepr):
                 gas_limit = await Transactions.estimate_gas(w3=client.w3, tx_params=tx_params)
 
             elif isinstance(gas_limit, int):
-                gas_limit = Wei(gas_limit)
+                gas_limit = Wei.cached(gas_limit)
 
             tx_params['gas'] = gas_limit.Wei
-            signed_tx = client.w3.eth.account.sign_transaction(
-                transaction_dict=tx_params, private_key=client.account.key
-            )
+            signed_tx = await client.transactions.sign_transaction(tx_params)
             tx_hash = await client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
             if tx_hash:
                 self.hash = tx_hash
-                self.params = tx_params.copy()
+                self.params = tx_params
                 return True
 
         return False
@@ -253,23 +259,32 @@ class Transactions:
         self.client = client
 
     @staticmethod
-    async def current_gas_price(w3: Web3Async) -> Wei:
+    async def current_gas_price(w3: Web3Async, fresh: bool = False) -> Wei:
         print("This method will be deprecated in a future update. Use 'gas_price' instead.")
-        return await Transactions.gas_price(w3=w3)
+        return await Transactions.gas_price(w3=w3, fresh=fresh)
 
     @staticmethod
-    async def gas_price(w3: Web3Async) -> Wei:
+    async def gas_price(w3: Web3Async, fresh: bool = False) -> Wei:
         """
-        Get the current gas price.
+        Get the current gas price. It's cached for 2 seconds, less than a block time, to avoid repeated requests
+            when sending several transactions.
 
         Args:
             w3 (Web3): the Web3 instance.
+            fresh (bool): if True, it requests the gas price even if a cached one is available. (False)
 
         Returns:
             Wei: the current gas price.
 
         """
-        return Wei(await w3.eth.gas_price)
+        now = time.monotonic()
+        cached = _gas_prices.get(w3)
+        if not fresh and cached and now - cached[0] < _GAS_PRICE_TTL:
+            return cached[1]
+
+        gas_price = Wei(await w3.eth.gas_price)
+        _gas_prices[w3] = (now, gas_price)
+        return gas_price
 
     @staticmethod
     async def max_priority_fee(w3: Web3Async) -> Wei:
@@ -379,7 +394,8 @@ class Transactions:
 
     async def sign_transaction(self, tx_params: TxParams) -> SignedTransaction:
         """
-        Sign a transaction.
+        Sign a transaction. Signing takes several milliseconds of CPU time, so it's done in a thread to keep the event
+            loop responsive.
 
         Args:
             tx_params (TxParams): parameters of the transaction.
@@ -388,9 +404,9 @@ class Transactions:
             SignedTransaction: the signed transaction.
 
         """
-        return self.client.w3.eth.account.sign_transaction(
-            transaction_dict=tx_params, private_key=self.client.account.key
-        )
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+            self.client.w3.eth.account.sign_transaction, transaction_dict=tx_params, private_key=self.client.account.key
+        ))
 
     async def sign_message(self, message: str) -> SignedMessage:
         """
@@ -442,10 +458,10 @@ class Transactions:
             address = self.client.account.address
 
         account_api = self.client.network.api.functions.account
-        coin_txs = (await account_api.txlist(address))['result']
-        internal_txs = (await account_api.txlistinternal(address))['result']
-        erc20_txs = (await account_api.tokentx(address))['result']
-        erc721_txs = (await account_api.tokennfttx(address))['result']
+        coin_txs, internal_txs, erc20_txs, erc721_txs = (response['result'] for response in await asyncio.gather(
+            account_api.txlist(address), account_api.txlistinternal(address), account_api.tokentx(address),
+            account_api.tokennfttx(address)
+        ))
         if raw:
             return RawTxHistory(
                 address=address, coin_txs=coin_txs, internal_txs=internal_txs, erc20_txs=erc20_txs,
@@ -477,31 +493,24 @@ class Transactions:
             Dict[str, CoinTx]: transactions found.
 
         """
-        contract_addresses = []
-        if isinstance(contract, list):
-            for contract_ in contract:
-                contract_address, abi = await self.client.contracts.get_contract_attributes(contract_)
-                contract_addresses.append(contract_address.lower())
+        contract_addresses = set()
+        if not isinstance(contract, list):
+            contract = [contract]
 
-        else:
-            contract_address, abi = await self.client.contracts.get_contract_attributes(contract)
-            contract_addresses.append(contract_address.lower())
+        for contract_ in contract:
+            contract_address, abi = await self.client.contracts.get_contract_attributes(contract_)
+            contract_addresses.add(contract_address.lower())
 
         if not address:
             address = self.client.account.address
 
-        txs = {}
         coin_txs = (await self.client.network.api.functions.account.txlist(address))['result']
-        for tx in coin_txs:
-            if (
-                    after_timestamp < int(tx.get('timeStamp')) < before_timestamp and
-                    tx.get('isError') == '0' and
-                    tx.get('to') in contract_addresses and
-                    function_name in tx.get('functionName')
-            ):
-                txs[tx.get('hash')] = CoinTx(data=tx)
-
-        return txs
+        return {
+            tx['hash']: CoinTx(data=tx) for tx in coin_txs
+            if tx.get('to') in contract_addresses and tx.get('isError') == '0'
+            and after_timestamp < int(tx['timeStamp']) < before_timestamp
+            and (not function_name or function_name in (tx.get('functionName') or ''))
+        }
 
     async def approved_amount(
             self, token: types.Contract, spender: types.Contract, owner: Optional[types.Address] = None
@@ -578,56 +587,40 @@ class Transactions:
             contract_address, abi = await self.client.contracts.get_contract_attributes(token)
             contract = await self.client.contracts.default_token(contract_address)
 
+        # The values below don't depend on each other, so they're requested concurrently
+        requests = {}
+        if contract:
+            requests['balance'] = contract.functions.balanceOf(self.client.account.address).call()
+            if isinstance(amount, (int, float)):
+                requests['decimals'] = contract.functions.decimals().call()
+
+        else:
+            requests['balance'] = self.client.w3.eth.get_balance(self.client.account.address)
+
+        results = await self._gather_tx_values(requests, gas_price, nonce, check_gas_price)
         if isinstance(amount, (int, float)):
             if contract:
-                amount = TokenAmount(amount=amount, decimals=await contract.functions.decimals().call())
+                amount = amount_to_wei(amount, decimals=results['decimals'])
 
             else:
-                amount = Ether(amount=amount)
-
-        amount = amount.Wei
-        recipient = checksum(recipient)
-        current_gas_price = await self.gas_price(w3=self.client.w3)
-        if not gas_price:
-            gas_price = current_gas_price
-
-        elif gas_price:
-            if isinstance(gas_price, (int, float)):
-                gas_price = GWei(gas_price)
-
-        if check_gas_price and current_gas_price > gas_price:
-            raise exceptions.GasPriceTooHigh()
-
-        if not nonce:
-            nonce = await self.client.wallet.nonce()
-
-        tx_params = {
-            'chainId': self.client.network.chain_id,
-            'nonce': nonce,
-            'from': self.client.account.address
-        }
-        if self.client.network.tx_type == 2:
-            tx_params['maxPriorityFeePerGas'] = (await self.client.transactions.max_priority_fee(w3=self.client.w3)).Wei
-            tx_params['maxFeePerGas'] = gas_price.Wei + tx_params['maxPriorityFeePerGas']
+                amount = Ether(amount=amount).Wei
 
         else:
-            tx_params['gasPrice'] = gas_price.Wei
+            amount = amount.Wei
 
-        if contract:
-            balance = (await self.client.wallet.balance(token=contract)).Wei
-            if balance < amount:
-                amount = balance
+        recipient = checksum(recipient)
+        tx_params = self._fee_params(results, gas_price, nonce, check_gas_price)
+        balance = results['balance']
+        if balance < amount:
+            amount = balance
 
+        if contract:
             tx_params.update({
                 'to': contract.address,
                 'data': contract.encodeABI('transfer', args=TxArgs(recipient=recipient, amount=amount).tuple())
             })
 
         else:
-            balance = (await self.client.wallet.balance()).Wei
-            if balance < amount:
-                amount = balance
-
             tx_params.update({
                 'to': recipient,
                 'value': amount
@@ -640,11 +633,10 @@ class Transactions:
             gas_limit = await self.estimate_gas(w3=self.client.w3, tx_params=tx_params)
 
         elif isinstance(gas_limit, int):
-            gas_limit = Wei(gas_limit)
+            gas_limit = Wei.cached(gas_limit)
 
         tx_params['gas'] = gas_limit.Wei
         if 'value' in tx_params:
-            balance = (await self.client.wallet.balance()).Wei
             gas_price = tx_params.get('gasPrice') if 'gasPrice' in tx_params else tx_params.get('maxFeePerGas')
             available_to_send = balance - int(gas_price * tx_params.get('gas') * 1.1)
             if available_to_send < amount:
@@ -679,49 +671,102 @@ class Transactions:
         """
         contract_address, abi = await self.client.contracts.get_contract_attributes(token)
         contract = await self.client.contracts.default_token(contract_address)
+        requests = {}
+        if amount and isinstance(amount, (int, float)):
+            requests['decimals'] = contract.functions.decimals().call()
+
+        results = await self._gather_tx_values(requests, gas_price, nonce, check_gas_price)
         if not amount:
             amount = CommonValues.InfinityInt
 
         elif isinstance(amount, (int, float)):
-            amount = TokenAmount(amount=amount, decimals=await contract.functions.decimals().call()).Wei
+            amount = amount_to_wei(amount, decimals=results['decimals'])
 
         else:
             amount = amount.Wei
 
         spender = checksum(spender)
-        current_gas_price = await self.gas_price(w3=self.client.w3)
+        tx_params = self._fee_params(results, gas_price, nonce, check_gas_price)
+        tx_params.update({
+            'to': contract.address,
+            'data': contract.encodeABI('approve', args=TxArgs(spender=spender, amount=amount).tuple())
+        })
+        if not gas_limit:
+            gas_limit = await self.estimate_gas(w3=self.client.w3, tx_params=tx_params)
+
+        elif isinstance(gas_limit, int):
+            gas_limit = Wei.cached(gas_limit)
+
+        tx_params['gas'] = gas_limit.Wei
+        return await self.sign_and_send(tx_params=tx_params)
+
+    async def _gather_tx_values(
+            self, requests: Dict[str, Any], gas_price: Optional[types.GasPrice], nonce: Optional[int],
+            check_gas_price: bool
+    ) -> Dict[str, Any]:
+        """
+        Concurrently request the values needed to build a transaction along with the gas price, the nonce and the max
+            priority fee if they aren't specified.
+
+        Args:
+            requests (Dict[str, Any]): the additional awaitables by the names of their results.
+            gas_price (Optional[GasPrice]): the specified gas price.
+            nonce (Optional[int]): the specified nonce.
+            check_gas_price (bool): whether the current gas price is needed to compare it with the specified one.
+
+        Returns:
+            Dict[str, Any]: the results by names.
+
+        """
+        if not gas_price or check_gas_price:
+            requests['gas_price'] = self.gas_price(w3=self.client.w3)
+
+        if not nonce:
+            requests['nonce'] = self.client.wallet.nonce()
+
+        if self.client.network.tx_type == 2:
+            requests['max_priority_fee'] = self.max_priority_fee(w3=self.client.w3)
+
+        return dict(zip(requests, await asyncio.gather(*requests.values())))
+
+    def _fee_params(
+            self, results: Dict[str, Any], gas_price: Optional[types.GasPrice], nonce: Optional[int],
+            check_gas_price: bool
+    ) -> TxParams:
+        """
+        Create transaction parameters with the chain ID, the nonce, the sender and the fee.
+
+        Args:
+            results (Dict[str, Any]): the results of the '_gather_tx_values' function.
+            gas_price (Optional[GasPrice]): the specified gas price.
+            nonce (Optional[int]): the specified nonce.
+            check_gas_price (bool): if True and the current gas price is higher than the specified one,
+                the 'GasPriceTooHigh' error will raise.
+
+        Returns:
+            TxParams: the transaction parameters.
+
+        """
+        current_gas_price = results.get('gas_price')
         if not gas_price:
             gas_price = current_gas_price
 
-        elif gas_price:
-            if isinstance(gas_price, (int, float)):
-                gas_price = GWei(gas_price)
+        elif isinstance(gas_price, (int, float)):
+            gas_price = GWei.cached(gas_price)
 
         if check_gas_price and current_gas_price > gas_price:
             raise exceptions.GasPriceTooHigh()
 
-        if not nonce:
-            nonce = await self.client.wallet.nonce()
-
         tx_params = {
             'chainId': self.client.network.chain_id,
-            'nonce': nonce,
-            'from': self.client.account.address,
-            'to': contract.address,
-            'data': contract.encodeABI('approve', args=TxArgs(spender=spender, amount=amount).tuple())
+            'nonce': nonce if nonce else results['nonce'],
+            'from': self.client.account.address
         }
         if self.client.network.tx_type == 2:
-            tx_params['maxPriorityFeePerGas'] = (await self.client.transactions.max_priority_fee(w3=self.client.w3)).Wei
+            tx_params['maxPriorityFeePerGas'] = results['max_priority_fee'].Wei
             tx_params['maxFeePerGas'] = gas_price.Wei + tx_params['maxPriorityFeePerGas']
 
         else:
             tx_params['gasPrice'] = gas_price.Wei
 
-        if not gas_limit:
-            gas_limit = await self.estimate_gas(w3=self.client.w3, tx_params=tx_params)
-
-        elif isinstance(gas_limit, int):
-            gas_limit = Wei(gas_limit)
-
-        tx_params['gas'] = gas_limit.Wei
-        return await self.sign_and_send(tx_params=tx_params)
+        return tx_params
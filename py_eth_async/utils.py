@@ -1,3 +1,6 @@
+import json
+import sys
+from functools import lru_cache
 from typing import Union, Optional, Dict, Any
 
 import aiohttp
@@ -6,6 +9,12 @@ from eth_utils import to_checksum_address
 
 from py_eth_async import exceptions
 
+try:
+    from orjson import loads as json_loads
+
+except ImportError:
+    json_loads = json.loads
+
 
 def api_key_required(func):
     """Check if the Blockscan API key is specified."""
@@ -20,9 +29,11 @@ def api_key_required(func):
     return func_wrapper
 
 
+@lru_cache(maxsize=4096)
 def checksum(address: str) -> ChecksumAddress:
     """
-    Convert an address to checksummed.
+    Convert an address to checksummed. Results are cached and interned since the same addresses come up over and over
+    again, e.g. in a transaction history.
 
     Args:
         address (str): the address.
@@ -31,7 +42,7 @@ def checksum(address: str) -> ChecksumAddress:
         ChecksumAddress: the checksummed address.
 
     """
-    return to_checksum_address(address)
+    return sys.intern(to_checksum_address(address))
 
 
 def aiohttp_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Union[str, int, float]]]:
@@ -64,27 +75,48 @@ def aiohttp_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Union
     return new_params
 
 
-async def async_get(url: str, headers: Optional[dict] = None, **kwargs) -> Optional[dict]:
+async def async_get(
+        url: str, headers: Optional[dict] = None, session: Optional[aiohttp.ClientSession] = None, **kwargs
+) -> Optional[dict]:
     """
     Make a GET request and check if it was successful.
 
     Args:
         url (str): a URL.
         headers (Optional[dict]): the headers. (None)
+        session (Optional[aiohttp.ClientSession]): a session to make the request with, it isn't closed afterwards.
+            (a new session for this request)
         **kwargs: arguments for a GET request, e.g. 'params', 'headers', 'data' or 'json'.
 
     Returns:
         Optional[dict]: received dictionary in response.
 
     """
+    if session:
+        return await _get(session.get(url=url, headers=headers, **kwargs))
+
     async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.get(url=url, **kwargs) as response:
-            status_code = response.status
-            response = await response.json()
-            if status_code <= 201:
-                return response
+        return await _get(session.get(url=url, **kwargs))
+
+
+async def _get(request) -> Optional[dict]:
+    """
+    Send a prepared GET request and check if it was successful.
+
+    Args:
+        request: the request context manager returned by a session.
+
+    Returns:
+        Optional[dict]: received dictionary in response.
+
+    """
+    async with request as response:
+        status_code = response.status
+        response = await response.json(loads=json_loads)
+        if status_code <= 201:
+            return response
 
-            raise exceptions.HTTPException(response=response, status_code=status_code)
+        raise exceptions.HTTPException(response=response, status_code=status_code)
 
 
 async def get_coin_symbol(chain_id: Union[int, str]) -> str:
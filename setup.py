@@ -20,6 +20,7 @@ setup(
         'fake-useragent', 'pretty-utils @ git+https://github.com/SecorD0/pretty-utils@main', 'PySocks==1.7.1',
         'python-dotenv==0.21.1', 'web3 @ git+https://github.com/ethereum/web3.py@v6.0.0-beta.9'
     ],
+    extras_require={'speedups': ['orjson', 'coincurve']},
     keywords=[
         'eth', 'pyeth', 'py-eth', 'ethpy', 'eth-py', 'web3', 'pyweb3', 'py-web3', 'web3py', 'web3-py', 'async-eth',
         'pyethasync', 'py-eth-async', 'asyncethpy', 'async-eth-py', 'async-web3', 'pyweb3-async', 'py-web3-async',
@@ -4,6 +4,7 @@ import random
 
 from web3.contract import AsyncContract
 
+from py_eth_async.blockscan_api import APIFunctions
 from py_eth_async.client import Client
 from py_eth_async.data.models import Networks, Wei, Ether, GWei, TokenAmount, Network, TxArgs
 from py_eth_async.transactions import Tx
@@ -373,6 +374,19 @@ Receipt:
 {dict(receipt)}''')
 
 
+class BlockscanAPI:
+    @staticmethod
+    async def balance_transport_error():
+        """Check that concurrent balance calls raise instead of hanging when the API is unreachable."""
+        print('\n--- balance_transport_error ---')
+        async with APIFunctions(key='', url='http://127.0.0.1:1/api') as api:
+            results = await asyncio.wait_for(asyncio.gather(
+                *(api.account.balance(address) for address in ('0x1', '0x2', '0x2')), return_exceptions=True
+            ), timeout=10)
+            assert all(isinstance(result, Exception) for result in results), results
+            print(f'Errors: {[type(result).__name__ for result in results]}')
+
+
 class Miscellaneous:
     @staticmethod
     async def custom_network():
@@ -612,6 +626,10 @@ async def main() -> None:
     await transactions.speed_up_token()
     await transactions.approve()
 
+    print('\n--------- Blockscan API ---------')
+    blockscan_api = BlockscanAPI()
+    await blockscan_api.balance_transport_error()
+
     print('\n--------- Miscellaneous ---------')
     miscellaneous = Miscellaneous()
     await miscellaneous.custom_network()